@@ -12,7 +12,6 @@ from typing import List, Optional
 from dotenv import load_dotenv
 from pathlib import Path
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn, TimeRemainingColumn
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
@@ -22,6 +21,7 @@ from parser import SessionParser
 from no_ai_summarizer import NoAISummarizer, UserOnlyExtractor, MessageExtractor
 from cache import SummaryCache
 from date_parser import parse_since_date, format_since_description
+from config import SUMMARY_TYPES
 from formatters import (
     TerminalFormatter,
     MarkdownFormatter,
@@ -258,12 +258,12 @@ def handle_list_sessions(project_path: Path, from_date, to_date, output_format:
     
     if output_format == 'terminal':
         formatter = TerminalFormatter(console)
-        formatter.format_session_list(sessions, verbose)
+        formatter.format_session_list(sessions, output_file, verbose)
         
         # Also show cache stats
         cache = SummaryCache()
         stats = cache.get_cache_stats()
-        formatter.format_cache_stats(stats)
+        formatter.format_cache_stats(stats, output_file)
         
     elif output_format == 'plain':
         formatter = PlainFormatter(separator)
@@ -342,17 +342,8 @@ def handle_session_summary(
 
     click.echo(f"Found {len(turns)} conversation turn(s)", err=True)
 
-    # Map summary type
-    if summary_type == 'default':
-        summary_type = 'work'
-
-    # Display summary type header
-    type_labels = {
-        'work': 'Work Summary',
-        'commit': 'Commit Message',
-        'requirements': 'Requirements'
-    }
-    label = type_labels.get(summary_type, 'Summary')
+    # Map summary type and display header
+    summary_type, label = SUMMARY_TYPES.get(summary_type, (summary_type, 'Summary'))
     click.echo(f"\nGenerating {label}...\n", err=True)
 
     # Generate summary using Summarizer
@@ -706,6 +697,9 @@ def handle_summarization(
 
         # Then process uncached turns with progress display
         if uncached_turns:
+            # Deferred: only needed when there is something to summarize
+            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn
+
             num_turns = len(uncached_turns)
             use_full_progress = num_turns >= 3
 
@@ -785,7 +779,7 @@ def handle_summarization(
         # Format and output
         if output_format == 'terminal':
             formatter = TerminalFormatter(console)
-            formatter.format_session_summary(turns, summaries, merged_session_metadata, include_metadata)
+            formatter.format_session_summary(turns, summaries, merged_session_metadata, include_metadata, output_file)
         elif output_format == 'plain':
             formatter = PlainFormatter(separator)
             formatter.format_session_summary(turns, summaries, merged_session_metadata, include_metadata, output_file)
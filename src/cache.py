@@ -10,7 +10,7 @@ from dataclasses import dataclass, asdict
 import shutil
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryResult:
     """Result of summarizing assistant messages."""
     summary: str
@@ -127,7 +127,12 @@ class SummaryCache:
         # Determine if this is an error result
         is_error = bool(result.error)
         cache_path = self._get_cache_path(cache_key, is_error)
-        
+
+        # Same (session, content, detail) already cached - skip the rewrite.
+        # Errors are always overwritten since they are retryable.
+        if not is_error and cache_path.exists():
+            return
+
         entry = CacheEntry(
             summary_result=result,
             cached_at=datetime.now(timezone.utc).isoformat(),
@@ -136,10 +141,14 @@ class SummaryCache:
             detail_level=detail_level
         )
         
+        # Write to a temp file and rename so readers never see a partial entry
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
         try:
-            with open(cache_path, 'w') as f:
+            with open(tmp_path, 'w') as f:
                 json.dump(entry.to_dict(), f, indent=2)
+            os.replace(tmp_path, cache_path)
         except IOError as e:
+            tmp_path.unlink(missing_ok=True)
             print(f"Warning: Failed to cache summary: {e}")
     
     def clear_cache(self, session_id: Optional[str] = None) -> int:
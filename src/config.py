@@ -9,17 +9,25 @@ TOOL_ARG_TRUNCATION = 100
 # Model configuration
 DEFAULT_MODEL = "claude-3-5-haiku-20241022"
 
+# Session-level summary types: CLI choice -> (summarizer type, display label)
+SUMMARY_TYPES = {
+    'default': ('work', 'Work Summary'),
+    'work': ('work', 'Work Summary'),
+    'commit': ('commit', 'Commit Message'),
+    'requirements': ('requirements', 'Requirements'),
+}
+
 # Default separator for plain text output
 DEFAULT_SEPARATOR = "—" * 24
 
 # Tool filtering by detail level
-MINIMAL_TOOLS = ['Edit', 'MultiEdit', 'Write', 'Bash']
-NORMAL_TOOLS = MINIMAL_TOOLS + ['Read', 'Grep', 'Glob', 'LS', 'Task']
+MINIMAL_TOOLS = frozenset(['Edit', 'MultiEdit', 'Write', 'Bash'])
+NORMAL_TOOLS = MINIMAL_TOOLS | frozenset(['Read', 'Grep', 'Glob', 'LS', 'Task'])
 # DETAILED_TOOLS = None means show all tools
 
 # Message categories
 ALL_CATEGORIES = ['user', 'subagent', 'plan', 'assistant', 'session_summary']
-EXCLUDED_CATEGORIES = {'system_noise', 'tool_response'}
+EXCLUDED_CATEGORIES = frozenset({'system_noise', 'tool_response'})
 
 # Category display labels
 CATEGORY_LABELS = {
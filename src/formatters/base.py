@@ -1,7 +1,8 @@
 """Base formatter interface for output formatters."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, TextIO, Optional
+from itertools import chain
+from typing import List, Dict, Any, Iterable, TextIO, Optional
 
 
 class BaseFormatter(ABC):
@@ -91,3 +92,33 @@ class BaseFormatter(ABC):
             Formatted string, or None if not implemented/output written directly
         """
         return None
+
+    def _write_sections(
+        self,
+        sections: Iterable[Iterable[str]],
+        output_file: Optional[TextIO] = None
+    ) -> Optional[str]:
+        """Join sections of lines into newline-separated output.
+
+        When output_file is provided each section is written as soon as it
+        is built, so only one section (e.g. one turn) is held in memory.
+
+        Args:
+            sections: Groups of output lines, in order
+            output_file: Optional file to write output to
+
+        Returns:
+            Formatted string, or None if output was written directly
+        """
+        if output_file is None:
+            return '\n'.join(chain.from_iterable(sections))
+
+        write = output_file.write
+        separator = ''
+        for section in sections:
+            lines = list(section)
+            if lines:
+                write(separator)
+                write('\n'.join(lines))
+                separator = '\n'
+        return None
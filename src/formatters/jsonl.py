@@ -1,8 +1,10 @@
 """JSONL output formatter for Claude Code sessions."""
 
+import io
 import json
 from datetime import datetime
-from typing import List, Dict, Any, TextIO, Optional
+from itertools import count
+from typing import List, Dict, Any, Iterable, TextIO, Optional
 
 try:
     from .base import BaseFormatter
@@ -13,6 +15,59 @@ except ImportError:
     from utils import extract_user_content
     from config import CATEGORY_LABELS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps_bytes(obj: Any) -> bytes:
+        """Serialize a record to compact UTF-8 JSON bytes using orjson.
+
+        Records orjson rejects (lone surrogates, ints beyond 64 bits) fall
+        back to json.dumps, whose ASCII escaping keeps them encodable.
+        """
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj).encode()
+
+    def _dumps(obj: Any) -> str:
+        """Serialize a record to compact JSON using orjson."""
+        return _dumps_bytes(obj).decode()
+
+    def _dumps_indented(obj: Any) -> str:
+        """Serialize a record to 2-space indented JSON using orjson."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, indent=2)
+
+    def _dumps_lines(records: Iterable[Any]) -> str:
+        """Serialize records to JSONL, joining bytes and decoding once."""
+        return b'\n'.join(map(_dumps_bytes, records)).decode()
+else:
+    def _dumps(obj: Any) -> str:
+        """Serialize a record to JSON with json.dumps defaults."""
+        return json.dumps(obj)
+
+    def _dumps_indented(obj: Any) -> str:
+        """Serialize a record to 2-space indented JSON."""
+        return json.dumps(obj, indent=2)
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        """Serialize a record to JSON bytes."""
+        return _dumps(obj).encode()
+
+    def _dumps_lines(records: Iterable[Any]) -> str:
+        """Serialize records to JSONL."""
+        return '\n'.join(map(_dumps, records))
+
+
+# Optional per-message fields included when metadata is requested
+_MESSAGE_METADATA_KEYS = ('timestamp', 'cwd', 'git_branch')
+
 
 class JSONLFormatter(BaseFormatter):
     """Formats session summaries as structured JSONL output."""
@@ -26,8 +81,6 @@ class JSONLFormatter(BaseFormatter):
         output_file: Optional[TextIO] = None
     ) -> Optional[str]:
         """Format a complete session summary as JSONL."""
-        lines = []
-
         # Session header record
         session_record = {
             "type": "session_header",
@@ -44,19 +97,14 @@ class JSONLFormatter(BaseFormatter):
                 "file_size": session_metadata.get('file_size')
             })
 
-        lines.append(json.dumps(session_record))
-
-        # Process each turn
-        for i, (turn, summary) in enumerate(zip(turns, summaries)):
-            turn_record = self._format_turn(i + 1, turn, summary, include_metadata)
-            lines.append(json.dumps(turn_record))
-
-        jsonl_content = '\n'.join(lines)
-
-        if output_file:
-            output_file.write(jsonl_content)
+        def records():
+            yield session_record
+            # Process each turn
+            format_turn = self._format_turn
+            for turn_num, turn, summary in zip(count(1), turns, summaries):
+                yield format_turn(turn_num, turn, summary, include_metadata)
 
-        return jsonl_content
+        return self._write_records(records(), output_file)
 
     def format_session_list(
         self,
@@ -65,38 +113,34 @@ class JSONLFormatter(BaseFormatter):
         verbose: bool = False
     ) -> Optional[str]:
         """Format session list as JSONL records."""
-        lines = []
-
         # Header record
         header_record = {
             "type": "session_list",
             "count": len(sessions),
             "timestamp": datetime.now().isoformat()
         }
-        lines.append(json.dumps(header_record))
-
-        # Session records
-        for session in sessions:
-            session_record = {
-                "type": "session_info",
-                "session_id": session.get('session_id'),
-                "message_count": session.get('message_count'),
-                "file_size": session.get('file_size'),
-                "start_time": session.get('start_time'),
-                "last_modified": session.get('last_modified'),
-                "description": session.get('description')
-            }
-
-            # Remove None values for cleaner JSON
-            session_record = {k: v for k, v in session_record.items() if v is not None}
-            lines.append(json.dumps(session_record))
-
-        jsonl_content = '\n'.join(lines)
 
-        if output_file:
-            output_file.write(jsonl_content)
+        if not sessions:
+            return self._write_records((header_record,), output_file)
+
+        def records():
+            yield header_record
+            # Session records
+            for session in sessions:
+                session_record = {
+                    "type": "session_info",
+                    "session_id": session.get('session_id'),
+                    "message_count": session.get('message_count'),
+                    "file_size": session.get('file_size'),
+                    "start_time": session.get('start_time'),
+                    "last_modified": session.get('last_modified'),
+                    "description": session.get('description')
+                }
 
-        return jsonl_content
+                # Remove None values for cleaner JSON
+                yield {k: v for k, v in session_record.items() if v is not None}
+
+        return self._write_records(records(), output_file)
 
     def format_messages(
         self,
@@ -106,8 +150,6 @@ class JSONLFormatter(BaseFormatter):
         output_file: Optional[TextIO] = None
     ) -> Optional[str]:
         """Format categorized messages as JSONL."""
-        lines = []
-
         # Header record
         header_record = {
             "type": "categorized_messages_session",
@@ -115,33 +157,58 @@ class JSONLFormatter(BaseFormatter):
             "message_count": len(messages),
             "timestamp": datetime.now().isoformat()
         }
-        lines.append(json.dumps(header_record))
-
-        # Message records
-        for message in messages:
-            message_record = {
-                "type": "categorized_message",
-                "number": message['number'],
-                "category": message['category'],
-                "content": message['content'],
-                "uuid": message['uuid']
-            }
-
-            if include_metadata:
-                if message.get('timestamp'):
-                    message_record["timestamp"] = message['timestamp']
-                if message.get('cwd'):
-                    message_record["cwd"] = message['cwd']
-                if message.get('git_branch'):
-                    message_record["git_branch"] = message['git_branch']
-
-            lines.append(json.dumps(message_record))
-
-        jsonl_content = '\n'.join(lines)
-        if output_file:
-            output_file.write(jsonl_content)
 
-        return jsonl_content
+        def records():
+            yield header_record
+            # Message records
+            for message in messages:
+                message_record = {
+                    "type": "categorized_message",
+                    "number": message['number'],
+                    "category": message['category'],
+                    "content": message['content'],
+                    "uuid": message['uuid']
+                }
+
+                if include_metadata:
+                    get = message.get
+                    message_record.update(
+                        (key, value) for key in _MESSAGE_METADATA_KEYS
+                        if (value := get(key))
+                    )
+
+                yield message_record
+
+        return self._write_records(records(), output_file)
+
+    def _write_records(
+        self,
+        records: Iterable[Dict[str, Any]],
+        output_file: Optional[TextIO] = None
+    ) -> Optional[str]:
+        """Serialize records as newline-separated JSON.
+
+        Records are streamed to output_file one at a time when provided,
+        so the full document is never held in memory. Binary files (e.g.
+        opened with 'wb' or io.BytesIO) receive encoded bytes directly.
+
+        Returns:
+            JSONL string, or None if output was written directly
+        """
+        if output_file is None:
+            return _dumps_lines(records)
+
+        if isinstance(output_file, (io.RawIOBase, io.BufferedIOBase)):
+            dumps, separator, newline = _dumps_bytes, b'', b'\n'
+        else:
+            dumps, separator, newline = _dumps, '', '\n'
+
+        write = output_file.write
+        for record in records:
+            write(separator)
+            write(dumps(record))
+            separator = newline
+        return None
 
     def format_cache_stats(
         self,
@@ -157,7 +224,7 @@ class JSONLFormatter(BaseFormatter):
             "total_size_bytes": stats.get('total_size_bytes', 0)
         }
 
-        json_content = json.dumps(cache_record, indent=2)
+        json_content = _dumps_indented(cache_record)
 
         if output_file:
             output_file.write(json_content)
@@ -172,16 +239,37 @@ class JSONLFormatter(BaseFormatter):
         include_metadata: bool = False
     ) -> Dict[str, Any]:
         """Format a single conversation turn as a JSON record."""
-        # Base turn record
+        message = turn.user_message
+
+        # Nested records are built inline and filled in place below
+        user_record = {
+            "uuid": message.uuid,
+            "content": extract_user_content(message.content),
+            "timestamp": message.timestamp
+        }
+        summary_record = {
+            "summary": summary.summary,
+            "tool_calls": summary.tool_calls
+        }
         turn_record = {
             "type": "conversation_turn",
             "turn_number": turn_num,
-            "user_message": self._format_user_message(turn.user_message, include_metadata),
-            "assistant_summary": self._format_assistant_summary(summary)
+            "user_message": user_record,
+            "assistant_summary": summary_record
         }
 
+        if summary.error:
+            summary_record["error"] = summary.error
+        if summary.tokens_used is not None:
+            summary_record["tokens_used"] = summary.tokens_used
+
         # Add metadata if requested
         if include_metadata:
+            if message.cwd:
+                user_record["cwd"] = message.cwd
+            if message.git_branch:
+                user_record["git_branch"] = message.git_branch
+
             if turn.duration_seconds is not None:
                 turn_record["duration_seconds"] = turn.duration_seconds
             if turn.total_tokens is not None:
@@ -193,34 +281,3 @@ class JSONLFormatter(BaseFormatter):
             turn_record["tool_message_count"] = len(turn.tool_messages)
 
         return turn_record
-
-    def _format_user_message(self, message, include_metadata: bool = False) -> Dict[str, Any]:
-        """Format user message as JSON record."""
-        user_record = {
-            "uuid": message.uuid,
-            "content": extract_user_content(message.content),
-            "timestamp": message.timestamp
-        }
-
-        if include_metadata:
-            if message.cwd:
-                user_record["cwd"] = message.cwd
-            if message.git_branch:
-                user_record["git_branch"] = message.git_branch
-
-        return user_record
-
-    def _format_assistant_summary(self, summary) -> Dict[str, Any]:
-        """Format assistant summary as JSON record."""
-        summary_record = {
-            "summary": summary.summary,
-            "tool_calls": summary.tool_calls
-        }
-
-        if summary.error:
-            summary_record["error"] = summary.error
-
-        if summary.tokens_used is not None:
-            summary_record["tokens_used"] = summary.tokens_used
-
-        return summary_record
@@ -1,8 +1,10 @@
 """Markdown output formatter for Claude Code sessions."""
 
 import sys
-from datetime import datetime
-from typing import List, Dict, Any, TextIO, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain, count
+from typing import List, Dict, Any, Iterator, TextIO, Optional
 
 try:
     from .base import BaseFormatter
@@ -24,6 +26,62 @@ except ImportError:
     from config import CATEGORY_LABELS
 
 
+# Complete output for an empty session list
+_EMPTY_SESSION_LIST = "# Available Claude Code Sessions\n\n_No sessions found._"
+
+# Title and table header preceding session-list rows
+_SESSION_LIST_HEADER = (
+    "# Available Claude Code Sessions\n"
+    "\n"
+    "| Session ID | Msgs | Size | Modified | Description |\n"
+    "|------------|------|------|----------|-------------|"
+)
+
+# Document header; {metadata} is empty or newline-prefixed metadata lines
+_HEADER_TEMPLATE = (
+    "# Claude Code Session Summary\n"
+    "\n"
+    "**Session ID:** `{session_id}`{metadata}\n"
+    "\n"
+    "---\n"
+)
+
+# Document footer; {fields} is empty or newline-terminated metadata lines
+_FOOTER_TEMPLATE = (
+    "---\n"
+    "\n"
+    "## Session Metadata\n"
+    "\n"
+    "{fields}\n"
+    "_Generated on {generated}_\n"
+)
+
+# Header of a categorized message listing
+_MESSAGES_HEADER_TEMPLATE = (
+    "# Messages from Session {session_id}\n"
+    "\n"
+    "**Session ID:** `{session_id}`\n"
+    "**Total Messages:** {message_count}\n"
+    "\n"
+    "---\n"
+)
+
+# Footer metadata lines as (key, template), emitted only when the value is truthy
+_FOOTER_FIELDS = (
+    ('session_id', "- **Session ID:** `{}`"),
+    ('message_count', "- **Total Messages:** {}"),
+    ('start_time', "- **Start Time:** {}"),
+    ('last_modified', "- **Last Modified:** {}"),
+    ('file_size', "- **File Size:** {} bytes"),
+)
+
+
+@lru_cache(maxsize=1)
+def _generated_on() -> str:
+    """Footer generation time, fixed once per run."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+
+
 class MarkdownFormatter(BaseFormatter):
     """Formats session summaries as Markdown documents."""
 
@@ -36,30 +94,28 @@ class MarkdownFormatter(BaseFormatter):
         output_file: Optional[TextIO] = None
     ) -> Optional[str]:
         """Format a complete session summary as Markdown."""
-        lines = []
-
-        # Document header
         session_id = session_metadata.get('session_id', 'Unknown')
-        lines.extend(self._format_header(session_id, session_metadata, include_metadata))
-
-        # Table of contents for long sessions
-        if len(turns) > 5:
-            lines.extend(self._format_toc(turns))
-
-        # Process each turn
-        for i, (turn, summary) in enumerate(zip(turns, summaries)):
-            lines.extend(self._format_turn(i + 1, turn, summary, include_metadata))
-
-        # Footer with metadata
-        if include_metadata:
-            lines.extend(self._format_footer(session_metadata))
-
-        markdown_content = '\n'.join(lines)
-
-        if output_file:
-            output_file.write(markdown_content)
-
-        return markdown_content
+        format_turn = self._format_turn
+
+        # Extract user content once; the TOC and each turn both need it
+        user_contents = [extract_user_content(turn.user_message.content) for turn in turns]
+
+        sections = chain(
+            # Document header
+            ((self._format_header(session_id, session_metadata, include_metadata),),),
+            # Table of contents for long sessions
+            (self._format_toc(user_contents),) if len(turns) > 5 else (),
+            # Process each turn
+            (
+                format_turn(turn_num, turn, summary, include_metadata, user_content)
+                for turn_num, turn, summary, user_content
+                in zip(count(1), turns, summaries, user_contents)
+            ),
+            # Footer with metadata
+            ((self._format_footer(session_metadata),),) if include_metadata else (),
+        )
+
+        return self._write_sections(sections, output_file)
 
     def format_session_list(
         self,
@@ -68,54 +124,18 @@ class MarkdownFormatter(BaseFormatter):
         verbose: bool = False
     ) -> Optional[str]:
         """Format session list as Markdown table."""
-        lines = []
-
-        lines.append("# Available Claude Code Sessions")
-        lines.append("")
-
         if not sessions:
-            lines.append("_No sessions found._")
-            markdown_content = '\n'.join(lines)
-
             if output_file:
-                output_file.write(markdown_content)
-
-            return markdown_content
-
-        # Create table
-        lines.append("| Session ID | Msgs | Size | Modified | Description |")
-        lines.append("|------------|------|------|----------|-------------|")
-
-        for session in sessions:
-            session_id = session.get('session_id', 'Unknown')
-            if not verbose:
-                # Elide at first hyphen
-                first_hyphen = session_id.find('-')
-                if first_hyphen > 0:
-                    session_id = session_id[:first_hyphen]
-            message_count = str(session.get('message_count', 0))
-
-            file_size = session.get('file_size', 0)
-            size_str = format_file_size(file_size)
+                output_file.write(_EMPTY_SESSION_LIST)
+                return None
 
-            last_modified = session.get('last_modified', '')
-            dt = parse_iso_timestamp(last_modified)
-            date_str = dt.strftime('%m-%d %H:%M') if dt else 'Unknown'
+            return _EMPTY_SESSION_LIST
 
-            description = session.get('description', '')
-            if len(description) > 50:
-                description = description[:47] + '...'
+        # Header, all rows, and trailing newline as three writes
+        format_row = self._format_session_row
+        rows = [format_row(session, verbose) for session in sessions]
 
-            lines.append(f"| `{session_id}` | {message_count} | {size_str} | {date_str} | {description} |")
-
-        lines.append("")
-
-        markdown_content = '\n'.join(lines)
-
-        if output_file:
-            output_file.write(markdown_content)
-
-        return markdown_content
+        return self._write_sections(((_SESSION_LIST_HEADER,), rows, ("",)), output_file)
 
     def format_messages(
         self,
@@ -125,110 +145,116 @@ class MarkdownFormatter(BaseFormatter):
         output_file: Optional[TextIO] = None
     ) -> Optional[str]:
         """Format categorized messages as Markdown."""
-        lines = []
         session_id = session_metadata.get('session_id', 'Unknown')
+        header = _MESSAGES_HEADER_TEMPLATE.format_map({
+            'session_id': session_id,
+            'message_count': len(messages),
+        })
+
+        format_message = self._format_message
+        sections = chain(
+            ((header,),),
+            (format_message(i, message) for i, message in enumerate(messages, 1)),
+        )
+
+        return self._write_sections(sections, output_file)
+
+    def _format_message(self, number: int, message: Dict[str, Any]) -> Iterator[str]:
+        """Format a single categorized message."""
+        category = message['category']
+        label = CATEGORY_LABELS.get(category, category.upper())
+
+        # Add timestamp to the header
+        timestamp_str = ""
+        dt = parse_iso_timestamp(message.get('timestamp'))
+        if dt:
+            timestamp_str = f" _{format_timestamp_short(dt)}_"
 
-        lines.append(f"# Messages from Session {session_id}")
-        lines.append("")
-        lines.append(f"**Session ID:** `{session_id}`")
-        lines.append(f"**Total Messages:** {len(messages)}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        for i, message in enumerate(messages, 1):
-            category = message['category']
-            label = CATEGORY_LABELS.get(category, category.upper())
-
-            # Add timestamp to the header
-            timestamp_str = ""
-            dt = parse_iso_timestamp(message.get('timestamp'))
-            if dt:
-                timestamp_str = f" _{format_timestamp_short(dt)}_"
+        yield f"## [{label}]{timestamp_str} Message {number}"
+        yield ""
 
-            lines.append(f"## [{label}]{timestamp_str} Message {i}")
-            lines.append("")
+        # Format content as blockquote
+        yield "> " + message['content'].replace('\n', '\n> ')
 
-            # Format content as blockquote
-            for line in message['content'].split('\n'):
-                lines.append(f"> {line}")
+        yield ""
+        yield "---"
+        yield ""
 
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+    def _format_session_row(self, session: Dict[str, Any], verbose: bool) -> str:
+        """Format one session as a Markdown table row."""
+        get = session.get
+        session_id = get('session_id', 'Unknown')
+        if not verbose:
+            # Elide at first hyphen
+            first_hyphen = session_id.find('-')
+            if first_hyphen > 0:
+                session_id = session_id[:first_hyphen]
 
-        markdown_content = '\n'.join(lines)
-        if output_file:
-            output_file.write(markdown_content)
+        size_str = format_file_size(get('file_size', 0))
 
-        return markdown_content
+        dt = parse_iso_timestamp(get('last_modified', ''))
+        date_str = dt.strftime('%m-%d %H:%M') if dt else 'Unknown'
 
-    def _format_header(self, session_id: str, metadata: Dict[str, Any], include_metadata: bool) -> List[str]:
-        """Format document header."""
-        lines = []
+        description = get('description', '')
+        if len(description) > 50:
+            description = description[:47] + '...'
 
-        # Main title
-        lines.append("# Claude Code Session Summary")
-        lines.append("")
+        return f"| `{session_id}` | {get('message_count', 0)} | {size_str} | {date_str} | {description} |"
 
-        # Session info
-        lines.append(f"**Session ID:** `{session_id}`")
+    def _format_header(self, session_id: str, metadata: Dict[str, Any], include_metadata: bool) -> str:
+        """Format document header."""
+        metadata_lines = []
 
         if include_metadata:
-            message_count = metadata.get('message_count', 'Unknown')
-            lines.append(f"**Messages:** {message_count}")
+            get = metadata.get
+            message_count = get('message_count', 'Unknown')
+            metadata_lines.append(f"**Messages:** {message_count}")
 
-            start_time = metadata.get('start_time')
+            start_time = get('start_time')
             if start_time:
                 dt = parse_iso_timestamp(start_time)
                 if dt:
                     formatted_time = dt.strftime('%B %d, %Y at %H:%M:%S UTC')
-                    lines.append(f"**Started:** {formatted_time}")
+                    metadata_lines.append(f"**Started:** {formatted_time}")
                 else:
-                    lines.append(f"**Started:** {start_time}")
+                    metadata_lines.append(f"**Started:** {start_time}")
 
-            file_size = metadata.get('file_size')
+            file_size = get('file_size')
             if file_size:
                 size_str = format_file_size(file_size)
-                lines.append(f"**File Size:** {size_str}")
+                metadata_lines.append(f"**File Size:** {size_str}")
 
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        return _HEADER_TEMPLATE.format_map({
+            'session_id': session_id,
+            'metadata': ''.join(f"\n{line}" for line in metadata_lines),
+        })
 
-        return lines
+    def _format_toc(self, user_contents: List[str]) -> Iterator[str]:
+        """Format table of contents from each turn's extracted user content."""
+        yield "## Table of Contents"
+        yield ""
 
-    def _format_toc(self, turns: List) -> List[str]:
-        """Format table of contents."""
-        lines = []
-        lines.append("## Table of Contents")
-        lines.append("")
-
-        for i, turn in enumerate(turns):
-            # Extract first line of user message for TOC
-            content = extract_user_content(turn.user_message.content)
-            first_line = content.split('\n')[0].strip()[:80]
+        for i, content in enumerate(user_contents):
+            # First line of user message for TOC
+            first_line = content.partition('\n')[0].strip()[:80]
             if len(first_line) < len(content):
                 first_line += "..."
 
-            lines.append(f"{i + 1}. [Turn {i + 1}: {first_line}](#turn-{i + 1})")
-
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+            yield f"{i + 1}. [Turn {i + 1}: {first_line}](#turn-{i + 1})"
 
-        return lines
+        yield ""
+        yield "---"
+        yield ""
 
     def _format_turn(
         self,
         turn_num: int,
         turn,
         summary,
-        include_metadata: bool = False
-    ) -> List[str]:
+        include_metadata: bool = False,
+        user_content: Optional[str] = None
+    ) -> Iterator[str]:
         """Format a single conversation turn."""
-        lines = []
-
         # Turn header
         anchor = f"turn-{turn_num}"
         header = f"## Turn {turn_num}"
@@ -243,24 +269,25 @@ class MarkdownFormatter(BaseFormatter):
             if metadata_parts:
                 header += f" _({', '.join(metadata_parts)})_"
 
-        lines.append(f'<a id="{anchor}"></a>')
-        lines.append(header)
-        lines.append("")
+        yield f'<a id="{anchor}"></a>'
+        yield header
+        yield ""
 
         # User message
-        lines.extend(self._format_user_message(turn.user_message, include_metadata))
+        yield from self._format_user_message(turn.user_message, include_metadata, user_content)
 
         # Assistant summary
-        lines.extend(self._format_assistant_summary(summary, turn.assistant_messages))
-
-        lines.append("")
-
-        return lines
+        yield from self._format_assistant_summary(summary, turn.assistant_messages)
 
-    def _format_user_message(self, message, include_metadata: bool = False) -> List[str]:
-        """Format user message."""
-        lines = []
+        yield ""
 
+    def _format_user_message(
+        self,
+        message,
+        include_metadata: bool = False,
+        content: Optional[str] = None
+    ) -> Iterator[str]:
+        """Format user message, reusing already-extracted content if given."""
         # User section header
         header = "### 👤 User"
         dt = parse_iso_timestamp(message.timestamp)
@@ -268,26 +295,22 @@ class MarkdownFormatter(BaseFormatter):
             time_str = format_timestamp_short(dt)
             header += f" _{time_str}_"
 
-        lines.append(header)
-        lines.append("")
+        yield header
+        yield ""
 
         # User content
-        content = extract_user_content(message.content)
+        if content is None:
+            content = extract_user_content(message.content)
         if not content.strip():
             content = "_[Empty message]_"
 
         # Format as blockquote
-        for line in content.split('\n'):
-            lines.append(f"> {line}")
+        yield "> " + content.replace('\n', '\n> ')
 
-        lines.append("")
+        yield ""
 
-        return lines
-
-    def _format_assistant_summary(self, summary, assistant_messages: List = None) -> List[str]:
+    def _format_assistant_summary(self, summary, assistant_messages: List = None) -> Iterator[str]:
         """Format assistant summary."""
-        lines = []
-
         # Assistant section header
         header = "### 🤖 Assistant"
 
@@ -301,61 +324,44 @@ class MarkdownFormatter(BaseFormatter):
         if summary.tokens_used:
             header += f" _{summary.tokens_used} tokens_"
 
-        lines.append(header)
-        lines.append("")
+        yield header
+        yield ""
 
         if summary.error:
-            lines.append("**❌ Error generating summary:**")
-            lines.append("")
-            lines.append("```")
-            lines.append(summary.error)
-            lines.append("```")
+            yield "**❌ Error generating summary:**"
+            yield ""
+            yield "```"
+            yield summary.error
+            yield "```"
         else:
             # Summary content
             if summary.summary:
-                lines.append(summary.summary)
+                yield summary.summary
             else:
-                lines.append("_[No summary available]_")
+                yield "_[No summary available]_"
 
             # Tool calls
             if summary.tool_calls:
-                lines.append("")
-                lines.append("**🔧 Tools used:**")
-                lines.append("")
+                yield ""
+                yield "**🔧 Tools used:**"
+                yield ""
 
                 for tool_call in summary.tool_calls:
-                    lines.append(f"- `{tool_call}`")
-
-        lines.append("")
+                    yield f"- `{tool_call}`"
 
-        return lines
+        yield ""
 
-    def _format_footer(self, metadata: Dict[str, Any]) -> List[str]:
+    def _format_footer(self, metadata: Dict[str, Any]) -> str:
         """Format document footer with metadata."""
-        lines = []
-        lines.append("---")
-        lines.append("")
-        lines.append("## Session Metadata")
-        lines.append("")
-
         # Format all available metadata
-        if metadata.get('session_id'):
-            lines.append(f"- **Session ID:** `{metadata['session_id']}`")
-
-        if metadata.get('message_count'):
-            lines.append(f"- **Total Messages:** {metadata['message_count']}")
-
-        if metadata.get('start_time'):
-            lines.append(f"- **Start Time:** {metadata['start_time']}")
-
-        if metadata.get('last_modified'):
-            lines.append(f"- **Last Modified:** {metadata['last_modified']}")
-
-        if metadata.get('file_size'):
-            lines.append(f"- **File Size:** {metadata['file_size']} bytes")
-
-        lines.append("")
-        lines.append(f"_Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}_")
-        lines.append("")
-
-        return lines
+        get = metadata.get
+        fields = ''.join(
+            f"{template.format(value)}\n"
+            for key, template in _FOOTER_FIELDS
+            if (value := get(key))
+        )
+
+        return _FOOTER_TEMPLATE.format_map({
+            'fields': fields,
+            'generated': _generated_on(),
+        })
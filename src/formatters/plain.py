@@ -1,7 +1,7 @@
 """Plain text output formatter for Claude Code sessions."""
 
 import sys
-from typing import List, Dict, Any, TextIO, Optional
+from typing import List, Dict, Any, Iterator, Sequence, TextIO, Optional
 
 try:
     from .base import BaseFormatter
@@ -29,6 +29,8 @@ class PlainFormatter(BaseFormatter):
     def __init__(self, separator: str = None):
         """Initialize with custom separator or default em-dashes."""
         self.separator = separator or DEFAULT_SEPARATOR
+        # Blank line, separator, blank line - pre-joined as a single section
+        self._separator_block = (f"\n{self.separator}\n",)
 
     def format_session_summary(
         self,
@@ -39,32 +41,10 @@ class PlainFormatter(BaseFormatter):
         output_file: Optional[TextIO] = None
     ) -> Optional[str]:
         """Format a complete session summary as plain text."""
-        output = output_file or sys.stdout
-        lines = []
-
-        # Session header (optional, only if metadata requested)
-        if include_metadata:
-            session_id = session_metadata.get('session_id', 'Unknown')
-            message_count = session_metadata.get('message_count', 0)
-            lines.append(f"Session: {session_id}")
-            lines.append(f"Messages: {message_count}")
-            lines.append(self.separator)
-
-        # Process each turn
-        for i, (turn, summary) in enumerate(zip(turns, summaries)):
-            if i > 0:  # Add separator between turns
-                lines.append("")
-                lines.append(self.separator)
-                lines.append("")
-
-            lines.extend(self._format_turn(turn, summary, include_metadata))
-
-        plain_content = '\n'.join(lines)
-
-        if output_file:
-            output_file.write(plain_content)
-
-        return plain_content
+        return self._write_sections(
+            self._summary_sections(turns, summaries, session_metadata, include_metadata),
+            output_file
+        )
 
     def format_session_list(
         self,
@@ -73,44 +53,16 @@ class PlainFormatter(BaseFormatter):
         verbose: bool = False
     ) -> Optional[str]:
         """Format session list as plain text."""
-        lines = []
-
-        lines.append("Available Claude Code Sessions")
-        lines.append(self.separator)
-        lines.append("")
+        header = ("Available Claude Code Sessions", self.separator, "")
 
         if not sessions:
-            lines.append("No sessions found.")
+            rows = ["No sessions found."]
         else:
-            for session in sessions:
-                session_id = session.get('session_id', 'Unknown')
-                if not verbose:
-                    # Elide at first hyphen
-                    first_hyphen = session_id.find('-')
-                    if first_hyphen > 0:
-                        session_id = session_id[:first_hyphen]
-                message_count = session.get('message_count', 0)
-
-                file_size = session.get('file_size', 0)
-                size_str = format_file_size(file_size)
-
-                last_modified = session.get('last_modified', '')
-                dt = parse_iso_timestamp(last_modified)
-                date_str = dt.strftime('%Y-%m-%d %H:%M') if dt else 'Unknown'
-
-                description = session.get('description', '')
-                if len(description) > 60:
-                    description = description[:57] + '...'
-
-                lines.append(f"{session_id} | {message_count} msgs | {size_str} | {date_str} | {description}")
-
-        lines.append("")
-        plain_content = '\n'.join(lines)
-
-        if output_file:
-            output_file.write(plain_content)
+            format_row = self._format_session_row
+            rows = [format_row(session, verbose) for session in sessions]
 
-        return plain_content
+        # Header, all rows, and trailing newline as three writes
+        return self._write_sections((header, rows, ("",)), output_file)
 
     def format_messages(
         self,
@@ -120,39 +72,90 @@ class PlainFormatter(BaseFormatter):
         output_file: Optional[TextIO] = None
     ) -> Optional[str]:
         """Format categorized messages as plain text."""
-        lines = []
-
-        session_id = session_metadata.get('session_id', 'Unknown')
-        lines.append(f"Messages from Session {session_id}")
-        lines.append(self.separator)
-        lines.append("")
+        return self._write_sections(
+            self._message_sections(messages, session_metadata),
+            output_file
+        )
 
-        if not messages:
-            lines.append("No messages found.")
-        else:
-            for message in messages:
-                # Add category label
-                category = message['category']
-                label = CATEGORY_LABELS.get(category, category.upper())
-
-                # Add timestamp to the label
-                timestamp_str = ""
-                dt = parse_iso_timestamp(message.get('timestamp'))
-                if dt:
-                    timestamp_str = f" [{format_timestamp_short(dt)}]"
+    def _summary_sections(
+        self,
+        turns: List,
+        summaries: List,
+        session_metadata: Dict[str, Any],
+        include_metadata: bool
+    ) -> Iterator[Sequence[str]]:
+        """Yield the header and each turn of a session summary."""
+        # Session header (optional, only if metadata requested)
+        if include_metadata:
+            session_id = session_metadata.get('session_id', 'Unknown')
+            message_count = session_metadata.get('message_count', 0)
+            yield [f"Session: {session_id}", f"Messages: {message_count}", self.separator]
 
-                lines.append(f"[{label}]{timestamp_str} {message['content']}")
+        # Process each turn
+        separator_block = self._separator_block
+        for i, (turn, summary) in enumerate(zip(turns, summaries)):
+            if i > 0:  # Add separator between turns
+                yield separator_block
 
-                if message != messages[-1]:  # Don't add separator after last message
-                    lines.append("")
-                    lines.append(self.separator)
-                    lines.append("")
+            yield self._format_turn(turn, summary, include_metadata)
 
-        plain_content = '\n'.join(lines)
-        if output_file:
-            output_file.write(plain_content)
+    def _message_sections(
+        self,
+        messages: List[Dict],
+        session_metadata: Dict[str, Any]
+    ) -> Iterator[Sequence[str]]:
+        """Yield the header and each categorized message."""
+        session_id = session_metadata.get('session_id', 'Unknown')
+        yield [f"Messages from Session {session_id}", self.separator, ""]
 
-        return plain_content
+        if not messages:
+            yield ["No messages found."]
+            return
+
+        separator_block = self._separator_block
+        get_label = CATEGORY_LABELS.get
+        parse_timestamp = parse_iso_timestamp
+        format_short = format_timestamp_short
+        last = len(messages) - 1
+        for i, message in enumerate(messages):
+            # Add category label
+            category = message['category']
+            label = get_label(category) or category.upper()
+
+            # Add timestamp to the label
+            timestamp_str = ""
+            dt = parse_timestamp(message.get('timestamp'))
+            if dt:
+                timestamp_str = f" [{format_short(dt)}]"
+
+            yield (f"[{label}]{timestamp_str} {message['content']}",)
+
+            if i != last:  # Don't add separator after last message
+                yield separator_block
+
+    def _format_session_row(self, session: Dict[str, Any], verbose: bool) -> str:
+        """Format one session as a plain text row."""
+        get = session.get
+        session_id = get('session_id', 'Unknown')
+        if not verbose:
+            # Elide at first hyphen
+            first_hyphen = session_id.find('-')
+            if first_hyphen > 0:
+                session_id = session_id[:first_hyphen]
+        message_count = get('message_count', 0)
+
+        file_size = get('file_size', 0)
+        size_str = format_file_size(file_size)
+
+        last_modified = get('last_modified', '')
+        dt = parse_iso_timestamp(last_modified)
+        date_str = dt.strftime('%Y-%m-%d %H:%M') if dt else 'Unknown'
+
+        description = get('description', '')
+        if len(description) > 60:
+            description = description[:57] + '...'
+
+        return f"{session_id} | {message_count} msgs | {size_str} | {date_str} | {description}"
 
     def _format_turn(
         self,
@@ -162,50 +165,55 @@ class PlainFormatter(BaseFormatter):
     ) -> List[str]:
         """Format a single conversation turn as plain text."""
         lines = []
+        append = lines.append
+        user_message = turn.user_message
 
         # User message
-        user_content = extract_user_content(turn.user_message.content)
+        user_content = extract_user_content(user_message.content)
 
         # Add timestamp for user message
-        dt = parse_iso_timestamp(turn.user_message.timestamp)
+        dt = parse_iso_timestamp(user_message.timestamp)
         if dt:
             timestamp = format_timestamp_short(dt)
-            lines.append(f"User [{timestamp}]:")
+            append(f"User [{timestamp}]:")
         else:
-            lines.append("User:")
+            append("User:")
 
         # User content
         if user_content.strip():
-            lines.append(user_content)
+            append(user_content)
         else:
-            lines.append("[Empty user message]")
+            append("[Empty user message]")
 
         # Assistant summary (if not user-only mode)
-        if summary and summary.summary:
-            lines.append("")  # Blank line between user and assistant
+        summary_text = summary.summary if summary else None
+        if summary_text:
+            append("")  # Blank line between user and assistant
 
             # Format assistant header with timestamp
             assistant_header = "Assistant"
-            if turn.assistant_messages and turn.assistant_messages[0].timestamp:
-                dt = parse_iso_timestamp(turn.assistant_messages[0].timestamp)
+            assistant_messages = turn.assistant_messages
+            if assistant_messages and assistant_messages[0].timestamp:
+                dt = parse_iso_timestamp(assistant_messages[0].timestamp)
                 if dt:
                     timestamp = format_timestamp_short(dt)
                     assistant_header += f" [{timestamp}]"
             assistant_header += ":"
-            lines.append(assistant_header)
+            append(assistant_header)
 
             # Add token count if available and metadata requested
-            if include_metadata and summary.tokens_used:
-                lines.append(f"[{summary.tokens_used} tokens]")
+            tokens_used = summary.tokens_used
+            if include_metadata and tokens_used:
+                append(f"[{tokens_used} tokens]")
 
-            lines.append(summary.summary)
+            append(summary_text)
 
             # Add tool calls if present and not empty
-            if summary.tool_calls:
-                lines.append("")
-                lines.append("Tools used:")
-                for tool_call in summary.tool_calls:
-                    lines.append(f"• {tool_call}")
+            tool_calls = summary.tool_calls
+            if tool_calls:
+                append("")
+                append("Tools used:")
+                lines.extend([f"• {tool_call}" for tool_call in tool_calls])
 
         return lines
 
@@ -1,11 +1,11 @@
 """Rich terminal output formatter for Claude Code sessions."""
 
-from typing import List, Dict, Any, Optional, TextIO
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional, TextIO, Tuple
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.text import Text
 from rich.panel import Panel
-from rich.table import Table
 from rich import box
 
 try:
@@ -32,6 +32,15 @@ except ImportError:
     from config import CONTENT_TRUNCATION_USER, CATEGORY_LABELS
 
 
+def _titled_panel_kwargs(border_style: str) -> Dict[str, Any]:
+    """Fixed Panel options for a left-titled panel with the given border."""
+    return {'title_align': 'left', 'border_style': border_style, 'padding': (0, 1)}
+
+
+# (title style, panel options) for categories without a configured color
+_DEFAULT_CATEGORY_STYLE = ('bold white', _titled_panel_kwargs('white'))
+
+
 class TerminalFormatter(BaseFormatter):
     """Formats session summaries for rich terminal display."""
 
@@ -61,6 +70,18 @@ class TerminalFormatter(BaseFormatter):
             'SUMMARY': 'bright_blue',
         }
 
+        # Title styles and panel options, built once rather than per panel
+        self._user_title_style = f"bold {self.colors['user']}"
+        self._assistant_title_style = f"bold {self.colors['assistant']}"
+        self._error_title_style = f"bold {self.colors['error']}"
+        self._user_panel_kwargs = _titled_panel_kwargs(self.colors['user'])
+        self._assistant_panel_kwargs = _titled_panel_kwargs(self.colors['assistant'])
+        self._error_panel_kwargs = _titled_panel_kwargs(self.colors['error'])
+        self._category_styles = {
+            label: (f"bold {color}", _titled_panel_kwargs(color))
+            for label, color in self.category_colors.items()
+        }
+
     def format_session_summary(
         self,
         turns: List,
@@ -70,16 +91,17 @@ class TerminalFormatter(BaseFormatter):
         output_file: Optional[TextIO] = None
     ) -> Optional[str]:
         """Format and display a complete session summary."""
-        # Session header
-        self._print_session_header(session_metadata)
+        with self._rendering(output_file):
+            # Session header
+            self._print_session_header(session_metadata)
 
-        # Process each turn
-        for i, (turn, summary) in enumerate(zip(turns, summaries)):
-            self._print_turn(i + 1, turn, summary, include_metadata)
+            # Process each turn
+            for i, (turn, summary) in enumerate(zip(turns, summaries)):
+                self._print_turn(i + 1, turn, summary, include_metadata)
 
-            # Add spacing between turns
-            if i < len(turns) - 1:
-                self.console.print()
+                # Add spacing between turns
+                if i < len(turns) - 1:
+                    self.console.print()
 
         return None  # Output written directly to console
 
@@ -91,9 +113,13 @@ class TerminalFormatter(BaseFormatter):
     ) -> Optional[str]:
         """Format and display a list of available sessions."""
         if not sessions:
-            self.console.print("No sessions found.", style=self.colors['metadata'])
+            with self._rendering(output_file):
+                self.console.print("No sessions found.", style=self.colors['metadata'])
             return None
 
+        # Deferred: only the session list renders a table
+        from rich.table import Table
+
         # Create table - expand to full width
         table = Table(
             title="Available Sessions",
@@ -112,33 +138,16 @@ class TerminalFormatter(BaseFormatter):
         # Description column takes remaining space
         table.add_column("Description", style="white", ratio=1, overflow="ellipsis", no_wrap=True)
 
-        for session in sessions:
-            session_id = session.get('session_id', 'Unknown')
-            if not verbose:
-                # Elide at first hyphen (show only the first segment of UUID)
-                first_hyphen = session_id.find('-')
-                if first_hyphen > 0:
-                    session_id = session_id[:first_hyphen]
-            message_count = str(session.get('message_count', 0))
-
-            # Format file size
-            file_size = session.get('file_size', 0)
-            size_str = format_file_size_short(file_size)
-
-            # Format date
-            last_modified = session.get('last_modified', '')
-            dt = parse_iso_timestamp(last_modified)
-            date_str = dt.strftime('%m-%d %H:%M') if dt else 'Unknown'
-
-            # Get description
-            description = session.get('description', '')
-            # Truncate very long descriptions for display
-            if len(description) > 100:
-                description = description[:97] + '...'
-
-            table.add_row(session_id, message_count, size_str, date_str, description)
-
-        self.console.print(table)
+        # Pre-format every row, then hand them to the table in one pass
+        format_row = self._format_session_row
+        rows = [format_row(session, verbose) for session in sessions]
+
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
+
+        with self._rendering(output_file):
+            self.console.print(table)
         return None
 
     def format_messages(
@@ -153,49 +162,45 @@ class TerminalFormatter(BaseFormatter):
         session_id = session_metadata.get('session_id', 'Unknown')[:8]
         header_text = f"Messages from Session {session_id}... ({len(messages)} messages)"
 
-        self.console.print(
-            Panel(
-                Text(header_text, style='bright_blue'),
-                box=box.ROUNDED,
-                border_style='blue',
-                padding=(0, 1)
-            )
-        )
-        self.console.print()
-
-        # Display each message with category labels
-        for i, message in enumerate(messages, 1):
-            # Format timestamp if available
-            timestamp_text = ""
-            dt = parse_iso_timestamp(message.get('timestamp'))
-            if dt:
-                timestamp_text = f" [{format_timestamp_short(dt)}]"
-
-            # Create title with category
-            category = message['category']
-            label = CATEGORY_LABELS.get(category, category.upper())
-            category_color = self.category_colors.get(label, 'white')
-
-            title = Text(f"[{label}] Message {i}", style=f"bold {category_color}")
-            if timestamp_text:
-                title.append(timestamp_text, style="dim white")
-
-            content = message['content']
-            if len(content) > CONTENT_TRUNCATION_USER:
-                content = content[:CONTENT_TRUNCATION_USER] + "\n\n[... content truncated ...]"
-
+        with self._rendering(output_file):
             self.console.print(
                 Panel(
-                    content,
-                    title=title,
-                    title_align="left",
-                    border_style=category_color,
+                    Text(header_text, style='bright_blue'),
+                    box=box.ROUNDED,
+                    border_style='blue',
                     padding=(0, 1)
                 )
             )
+            self.console.print()
+
+            # Display each message with category labels
+            category_styles = self._category_styles
+            for i, message in enumerate(messages, 1):
+                # Format timestamp if available
+                timestamp_text = ""
+                dt = parse_iso_timestamp(message.get('timestamp'))
+                if dt:
+                    timestamp_text = f" [{format_timestamp_short(dt)}]"
+
+                # Create title with category
+                category = message['category']
+                label = CATEGORY_LABELS.get(category) or category.upper()
+                title_style, panel_kwargs = category_styles.get(label, _DEFAULT_CATEGORY_STYLE)
+
+                title = Text(f"[{label}] Message {i}", style=title_style)
+                if timestamp_text:
+                    title.append(timestamp_text, style="dim white")
+
+                content = message['content']
+                if len(content) > CONTENT_TRUNCATION_USER:
+                    content = content[:CONTENT_TRUNCATION_USER] + "\n\n[... content truncated ...]"
+
+                self.console.print(
+                    Panel(content, title=title, **panel_kwargs)
+                )
 
-            if i < len(messages):
-                self.console.print()
+                if i < len(messages):
+                    self.console.print()
 
         return None
 
@@ -205,34 +210,93 @@ class TerminalFormatter(BaseFormatter):
         output_file: Optional[TextIO] = None
     ) -> Optional[str]:
         """Format and display cache statistics."""
-        total_summaries = stats.get('successful_summaries', 0) + stats.get('failed_summaries', 0)
-        cache_size = stats.get('total_size_bytes', 0)
+        get = stats.get
+        successful = get('successful_summaries', 0)
+        failed = get('failed_summaries', 0)
+        total_summaries = successful + failed
+        cache_size = get('total_size_bytes', 0)
         size_str = format_file_size(cache_size)
 
-        cache_info = [
-            "📦 Cache Statistics",
-            "",
-            f"Total cached summaries: {total_summaries}",
-            f"  • Successful: {stats.get('successful_summaries', 0)}",
-            f"  • Failed: {stats.get('failed_summaries', 0)}",
-            f"Cache size: {size_str}",
-        ]
+        cache_info = (
+            "📦 Cache Statistics\n"
+            "\n"
+            f"Total cached summaries: {total_summaries}\n"
+            f"  • Successful: {successful}\n"
+            f"  • Failed: {failed}\n"
+            f"Cache size: {size_str}"
+        )
 
-        self.console.print(
-            Panel(
-                "\n".join(cache_info),
-                border_style=self.colors['metadata'],
-                padding=(0, 1)
+        with self._rendering(output_file):
+            self.console.print(
+                Panel(
+                    cache_info,
+                    border_style=self.colors['metadata'],
+                    padding=(0, 1)
+                )
             )
-        )
         return None
 
+    @contextmanager
+    def _rendering(self, output_file: Optional[TextIO] = None) -> Iterator[Console]:
+        """Buffer a render so it reaches its destination in one write.
+
+        When output_file is a separate, non-terminal file, prints are
+        redirected to a plain console on that file for the duration, so no
+        ANSI styling is generated for it.
+        """
+        console = self.console
+        if (
+            output_file is not None
+            and output_file is not console.file
+            and not output_file.isatty()
+        ):
+            self.console = Console(
+                file=output_file,
+                force_terminal=False,
+                color_system=None,
+                width=console.width
+            )
+        try:
+            with self.console:
+                yield self.console
+        finally:
+            self.console = console
+
+    def _format_session_row(self, session: Dict[str, Any], verbose: bool) -> Tuple[str, ...]:
+        """Format one session's table cells."""
+        get = session.get
+        session_id = get('session_id', 'Unknown')
+        if not verbose:
+            # Elide at first hyphen (show only the first segment of UUID)
+            first_hyphen = session_id.find('-')
+            if first_hyphen > 0:
+                session_id = session_id[:first_hyphen]
+        message_count = str(get('message_count', 0))
+
+        # Format file size
+        file_size = get('file_size', 0)
+        size_str = format_file_size_short(file_size)
+
+        # Format date
+        last_modified = get('last_modified', '')
+        dt = parse_iso_timestamp(last_modified)
+        date_str = dt.strftime('%m-%d %H:%M') if dt else 'Unknown'
+
+        # Get description
+        description = get('description', '')
+        # Truncate very long descriptions for display
+        if len(description) > 100:
+            description = description[:97] + '...'
+
+        return session_id, message_count, size_str, date_str, description
+
     def _print_session_header(self, metadata: Dict[str, Any]) -> None:
         """Print session overview header."""
-        session_id = metadata.get('session_id', 'Unknown')[:8]
-        message_count = metadata.get('message_count', 0)
-        start_time = metadata.get('start_time', '')
-        file_size = metadata.get('file_size', 0)
+        get = metadata.get
+        session_id = get('session_id', 'Unknown')[:8]
+        message_count = get('message_count', 0)
+        start_time = get('start_time', '')
+        file_size = get('file_size', 0)
 
         size_str = format_file_size(file_size)
 
@@ -270,16 +334,15 @@ class TerminalFormatter(BaseFormatter):
             elif turn.total_tokens:
                 turn_header += f" ({turn.total_tokens} tokens)"
 
-        self.console.print(Text(turn_header, style="bold"))
+        # Render header and both panels in a single print
+        self.console.print(Group(
+            Text(turn_header, style="bold"),
+            self._build_user_panel(turn.user_message, include_metadata),
+            self._build_assistant_panel(summary, turn.assistant_messages),
+        ))
 
-        # User message
-        self._print_user_message(turn.user_message, include_metadata)
-
-        # Assistant summary
-        self._print_assistant_summary(summary, turn.assistant_messages)
-
-    def _print_user_message(self, message, include_metadata: bool = False) -> None:
-        """Print user message with formatting."""
+    def _build_user_panel(self, message, include_metadata: bool = False) -> Panel:
+        """Build the user message panel."""
         content = extract_user_content(message.content)
 
         if not content.strip():
@@ -296,38 +359,25 @@ class TerminalFormatter(BaseFormatter):
             timestamp_text = f" [{format_timestamp_short(dt)}]"
 
         # User message panel
-        user_text = Text("👤 User", style=f"bold {self.colors['user']}")
+        user_text = Text("👤 User", style=self._user_title_style)
         if timestamp_text:
             user_text.append(timestamp_text, style=self.colors['timestamp'])
 
-        self.console.print(
-            Panel(
-                content,
-                title=user_text,
-                title_align="left",
-                border_style=self.colors['user'],
-                padding=(0, 1)
-            )
-        )
+        return Panel(content, title=user_text, **self._user_panel_kwargs)
 
-    def _print_assistant_summary(self, summary, assistant_messages: List = None) -> None:
-        """Print assistant summary with tool calls."""
+    def _build_assistant_panel(self, summary, assistant_messages: List = None) -> Panel:
+        """Build the assistant summary panel with tool calls."""
         if summary.error:
             # Error case
-            error_text = Text("❌ Assistant (Error)", style=f"bold {self.colors['error']}")
-            self.console.print(
-                Panel(
-                    f"Failed to generate summary: {summary.error}",
-                    title=error_text,
-                    title_align="left",
-                    border_style=self.colors['error'],
-                    padding=(0, 1)
-                )
+            error_text = Text("❌ Assistant (Error)", style=self._error_title_style)
+            return Panel(
+                f"Failed to generate summary: {summary.error}",
+                title=error_text,
+                **self._error_panel_kwargs
             )
-            return
 
         # Success case
-        assistant_text = Text("🤖 Assistant", style=f"bold {self.colors['assistant']}")
+        assistant_text = Text("🤖 Assistant", style=self._assistant_title_style)
 
         # Add timestamp from first assistant message
         if assistant_messages and assistant_messages[0].timestamp:
@@ -340,29 +390,20 @@ class TerminalFormatter(BaseFormatter):
             assistant_text.append(f" [{summary.tokens_used} tokens]", style=self.colors['metadata'])
 
         # Main content
-        content_parts = []
-
-        if summary.summary:
-            content_parts.append(summary.summary)
-
-        # Add tool calls if present
-        if summary.tool_calls:
-            content_parts.append("")  # Spacing
-            content_parts.append("🔧 Tools used:")
-            for tool_call in summary.tool_calls[:10]:  # Limit to 10 tools
-                content_parts.append(f"  • {tool_call}")
-
-            if len(summary.tool_calls) > 10:
-                content_parts.append(f"  • ... and {len(summary.tool_calls) - 10} more")
-
-        content = "\n".join(content_parts) if content_parts else "[No summary available]"
-
-        self.console.print(
-            Panel(
-                content,
-                title=assistant_text,
-                title_align="left",
-                border_style=self.colors['assistant'],
-                padding=(0, 1)
-            )
-        )
+        summary_text = summary.summary
+        tool_calls = summary.tool_calls
+
+        if not tool_calls:
+            content = summary_text or "[No summary available]"
+        else:
+            # Add tool calls, limited to 10
+            tool_count = len(tool_calls)
+            shown = tool_calls[:10] if tool_count > 10 else tool_calls
+            tool_lines = "\n".join([f"  • {tool_call}" for tool_call in shown])
+            if tool_count > 10:
+                tool_lines += f"\n  • ... and {tool_count - 10} more"
+
+            tools_block = f"🔧 Tools used:\n{tool_lines}"
+            content = f"{summary_text}\n\n{tools_block}" if summary_text else f"\n{tools_block}"
+
+        return Panel(content, title=assistant_text, **self._assistant_panel_kwargs)
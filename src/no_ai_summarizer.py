@@ -1,10 +1,47 @@
 """No-AI summarizer that uses existing summaries and todos from session logs."""
 
-import hashlib
 from typing import List, Optional
-from parser import Message, ConversationTurn
+from parser import ConversationTurn
 from cache import SummaryResult
-
+from utils import extract_user_content
+from config import EXCLUDED_CATEGORIES
+
+
+# System message text that indicates todo/task progress
+_TODO_INDICATORS = (
+    "todowrite",
+    "todo",
+    "task",
+    "working on",
+    "implementing",
+    "starting",
+    "completing",
+    "finished",
+    "adding",
+    "creating",
+)
+
+# Pure formatting/caveat messages injected around local commands
+_NOISE_PATTERNS = (
+    "caveat: the messages below",
+    "do not respond to these messages",
+    "kept model as",
+)
+
+# Session continuation indicators
+_SESSION_SUMMARY_PHRASES = (
+    "this session is being continued",
+    "analysis:",
+    "summary:",
+    "looking through the conversation chronologically",
+    "the conversation is summarized below",
+    "primary request and intent",
+    "key technical concepts",
+    "files and code sections",
+)
+
+# Categories extracted when none are requested
+_DEFAULT_CATEGORIES = frozenset(("user", "subagent", "plan", "assistant"))
 
 class NoAISummarizer:
     """Extracts existing summaries and todos from session logs without AI."""
@@ -20,25 +57,26 @@ class NoAISummarizer:
         # Look for existing summary messages in the turn
         existing_summaries = []
         todo_activities = []
+        tool_calls = []
 
-        # Check system messages for TodoWrite activities
-        for msg in turn.system_messages:
-            if self._is_todo_activity(msg):
-                todo_activities.append(self._extract_todo_content(msg))
-
-        # Check for summary type messages
-        for msg in turn.assistant_messages + turn.system_messages:
+        # Assistant messages: summaries plus tool calls for context
+        for msg in turn.assistant_messages:
             if msg.type == "summary":
                 existing_summaries.append(str(msg.content))
-
-        # Extract tool calls for context
-        tool_calls = []
-        for msg in turn.assistant_messages:
             if msg.tool_name:
                 tool_calls.append(
                     f"{msg.tool_name}: {self._format_tool_args(msg.tool_args)}"
                 )
 
+        # System messages: summaries plus TodoWrite activities, sharing one
+        # stringified copy of the content
+        for msg in turn.system_messages:
+            content = str(msg.content)
+            if msg.type == "summary":
+                existing_summaries.append(content)
+            if msg.content and self._is_todo_activity(content):
+                todo_activities.append(self._extract_todo_content(content))
+
         # Build summary from available information
         summary_parts = []
 
@@ -68,37 +106,21 @@ class NoAISummarizer:
             tokens_used=None,  # No API calls made
         )
 
-    def _is_todo_activity(self, msg: Message) -> bool:
-        """Check if a system message relates to todo activities."""
-        if not msg.content:
-            return False
+    def _is_todo_activity(self, content: str) -> bool:
+        """Check if system message content relates to todo activities."""
+        content_lower = content.lower()
+        return any(indicator in content_lower for indicator in _TODO_INDICATORS)
 
-        content_lower = str(msg.content).lower()
-        todo_indicators = [
-            "todowrite",
-            "todo",
-            "task",
-            "working on",
-            "implementing",
-            "starting",
-            "completing",
-            "finished",
-            "adding",
-            "creating",
-        ]
-
-        return any(indicator in content_lower for indicator in todo_indicators)
-
-    def _extract_todo_content(self, msg: Message) -> str:
+    def _extract_todo_content(self, content: str) -> str:
         """Extract meaningful content from todo-related system messages."""
-        content = str(msg.content)
+        content_lower = content.lower()
 
         # Clean up formatting and extract key information
-        if "todowrite" in content.lower():
+        if "todowrite" in content_lower:
             return "Updated todo list with current tasks"
-        elif "completed successfully" in content.lower():
+        elif "completed successfully" in content_lower:
             return "Completed task successfully"
-        elif "running" in content.lower() and "tool" in content.lower():
+        elif "running" in content_lower and "tool" in content_lower:
             return "Executing tools and commands"
         else:
             # Generic cleanup
@@ -118,25 +140,18 @@ class NoAISummarizer:
         if "file_path" in tool_args:
             return tool_args["file_path"]
         elif "command" in tool_args:
-            cmd = tool_args["command"]
-            return cmd[:50] + ("..." if len(cmd) > 50 else "")
+            return _preview(tool_args["command"], 50, False)
         elif "pattern" in tool_args:
             return f"pattern: {tool_args['pattern']}"
         else:
-            # Generic handling
-            return str(tool_args)[:50] + ("..." if len(str(tool_args)) > 50 else "")
+            # Generic handling; the dict repr is built only once
+            return _preview(str(tool_args), 50, False)
 
     def summarize_session(
         self, turns: List[ConversationTurn], session_id: str = ""
     ) -> List[SummaryResult]:
         """Summarize all turns in a session using existing log data."""
-        results = []
-
-        for turn in turns:
-            result = self.summarize_turn(turn, session_id)
-            results.append(result)
-
-        return results
+        return [self.summarize_turn(turn, session_id) for turn in turns]
 
 
 class UserOnlyExtractor:
@@ -151,16 +166,18 @@ class UserOnlyExtractor:
         prompt_number = 1  # Sequential numbering for actual prompts only
 
         for turn in turns:
+            user_message = turn.user_message
+
             # Skip summary messages (type='summary' from session continuation)
-            if turn.user_message.type == "summary":
+            if user_message.type == "summary":
                 continue
 
             # Skip turns that are actually tool responses
-            if self._is_tool_response(turn.user_message):
+            if self._is_tool_response(user_message):
                 continue
 
             # Extract clean user content
-            content = self._extract_user_content(turn.user_message.content)
+            content = extract_user_content(user_message.content)
 
             # Skip empty or very short content
             if not content or len(content.strip()) < 5:
@@ -176,16 +193,16 @@ class UserOnlyExtractor:
 
             prompt_data = {
                 "turn_number": prompt_number,
-                "timestamp": turn.user_message.timestamp,
+                "timestamp": user_message.timestamp,
                 "content": content,
-                "uuid": turn.user_message.uuid,
+                "uuid": user_message.uuid,
             }
 
             # Add optional metadata
-            if turn.user_message.cwd:
-                prompt_data["cwd"] = turn.user_message.cwd
-            if turn.user_message.git_branch:
-                prompt_data["git_branch"] = turn.user_message.git_branch
+            if user_message.cwd:
+                prompt_data["cwd"] = user_message.cwd
+            if user_message.git_branch:
+                prompt_data["git_branch"] = user_message.git_branch
 
             prompts.append(prompt_data)
             prompt_number += 1
@@ -198,24 +215,21 @@ class UserOnlyExtractor:
         if not prompts:
             return prompts
 
-        seen_content_hashes = set()
-        unique_prompts = []
-
-        # Sort by timestamp to keep earliest occurrence
-        sorted_prompts = sorted(prompts, key=lambda p: p.get("timestamp", ""))
-
-        for prompt in sorted_prompts:
+        # Keep the earliest occurrence of each content in one pass; the input
+        # index breaks timestamp ties the way a stable sort would
+        earliest = {}
+        for index, prompt in enumerate(prompts):
             content = prompt["content"]
-            # Use the same hashing approach as the parser
-            content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
-
-            if content_hash not in seen_content_hashes:
-                seen_content_hashes.add(content_hash)
-                unique_prompts.append(prompt)
+            timestamp = prompt.get("timestamp", "")
+            kept = earliest.get(content)
+            if kept is None or timestamp < kept[0]:
+                earliest[content] = (timestamp, index, prompt)
 
-        # Renumber the prompts after deduplication
-        for i, prompt in enumerate(unique_prompts, 1):
-            prompt["turn_number"] = i
+        # Order the survivors by timestamp and renumber them
+        unique_prompts = []
+        for number, (_, _, prompt) in enumerate(sorted(earliest.values()), 1):
+            prompt["turn_number"] = number
+            unique_prompts.append(prompt)
 
         return unique_prompts
 
@@ -233,82 +247,32 @@ class UserOnlyExtractor:
 
     def _is_system_noise(self, content: str) -> bool:
         """Check if content is system noise rather than actual user input."""
-        content_lower = content.lower().strip()
-
         # Skip command-related messages
         if (
-            content.startswith("<command-")
-            or content.startswith("<local-command-")
+            content.startswith(("<command-", "<local-command-"))
             or "command-message" in content
             or "[Request interrupted" in content
         ):
             return True
 
+        content_lower = content.lower().strip()
+
         # Skip very short generic responses
         if len(content_lower) < 10:
             return True
 
         # Skip pure formatting/caveat messages
-        noise_patterns = [
-            "caveat: the messages below",
-            "do not respond to these messages",
-            "kept model as",
-        ]
-
-        for pattern in noise_patterns:
-            if pattern in content_lower:
-                return True
-
-        return False
+        return any(pattern in content_lower for pattern in _NOISE_PATTERNS)
 
     def _is_session_summary(self, content: str) -> bool:
         """Check if content is a session continuation summary."""
         if not content:
             return False
 
-        content_lower = content.lower().strip()
+        content_lower = content.lower()
 
         # Check for session continuation indicators
-        session_summary_phrases = [
-            "this session is being continued",
-            "analysis:",
-            "summary:",
-            "looking through the conversation chronologically",
-            "the conversation is summarized below",
-            "primary request and intent",
-            "key technical concepts",
-            "files and code sections",
-        ]
-
-        return any(phrase in content_lower for phrase in session_summary_phrases)
-
-    def _extract_user_content(self, content) -> str:
-        """Extract clean text from user message content."""
-        if isinstance(content, str):
-            # Clean up session hooks and other noise
-            content = content.replace("<session-start-hook>", "")
-            content = content.replace("</session-start-hook>", "")
-            return content.strip()
-
-        elif isinstance(content, list):
-            # Handle tool results and complex content
-            parts = []
-            for item in content:
-                if isinstance(item, dict):
-                    if item.get("type") == "text":
-                        parts.append(item.get("text", ""))
-                    elif item.get("type") == "tool_result":
-                        # Skip tool results in user display - they're noise
-                        continue
-                    else:
-                        # Other content types
-                        parts.append(str(item))
-                else:
-                    parts.append(str(item))
-            return "\n".join(parts).strip()
-
-        else:
-            return str(content)
+        return any(phrase in content_lower for phrase in _SESSION_SUMMARY_PHRASES)
 
 
 class MessageExtractor:
@@ -327,46 +291,40 @@ class MessageExtractor:
             categories: List of categories to extract. If None, extracts all.
                        Valid categories: 'user', 'subagent', 'plan', 'assistant', 'session_summary', 'tool_response'
         """
-        if categories is None:
-            categories = ["user", "subagent", "plan", "assistant"]
-
-        # Always exclude noise categories
-        excluded_categories = {"system_noise", "tool_response"}
+        # Fold the always-excluded noise categories into one set lookup
+        wanted = (
+            _DEFAULT_CATEGORIES if categories is None else frozenset(categories)
+        ) - EXCLUDED_CATEGORIES
 
         messages = []
         message_number = 1
 
         for turn in turns:
             # Process user message
-            if (
-                turn.user_message.message_category in categories
-                and turn.user_message.message_category not in excluded_categories
-            ):
-                content = self._extract_content(turn.user_message.content)
+            user_message = turn.user_message
+            if user_message.message_category in wanted:
+                content = self._extract_content(user_message.content)
                 if content and len(content.strip()) > 5:
                     message_data = {
                         "number": message_number,
-                        "category": turn.user_message.message_category,
-                        "timestamp": turn.user_message.timestamp,
+                        "category": user_message.message_category,
+                        "timestamp": user_message.timestamp,
                         "content": content,
-                        "uuid": turn.user_message.uuid,
+                        "uuid": user_message.uuid,
                     }
 
                     # Add optional metadata
-                    if turn.user_message.cwd:
-                        message_data["cwd"] = turn.user_message.cwd
-                    if turn.user_message.git_branch:
-                        message_data["git_branch"] = turn.user_message.git_branch
+                    if user_message.cwd:
+                        message_data["cwd"] = user_message.cwd
+                    if user_message.git_branch:
+                        message_data["git_branch"] = user_message.git_branch
 
                     messages.append(message_data)
                     message_number += 1
 
             # Process assistant messages (for plans, etc.)
             for assistant_msg in turn.assistant_messages:
-                if (
-                    assistant_msg.message_category in categories
-                    and assistant_msg.message_category not in excluded_categories
-                ):
+                if assistant_msg.message_category in wanted:
                     content = self._extract_content(assistant_msg.content)
                     if content and len(content.strip()) > 5:
                         message_data = {
@@ -385,14 +343,13 @@ class MessageExtractor:
     def _extract_content(self, content) -> str:
         """Extract clean text from message content."""
         if isinstance(content, str):
-            # Clean up session hooks and other noise
-            content = content.replace("<session-start-hook>", "")
-            content = content.replace("</session-start-hook>", "")
-            return content.strip()
+            # Clean up session hooks and other noise in a single regex pass
+            return extract_user_content(content)
 
         elif isinstance(content, list):
             # Handle complex content structures
             parts = []
+            no_truncate = self.no_truncate
             for item in content:
                 if isinstance(item, dict):
                     if item.get("type") == "text":
@@ -406,110 +363,13 @@ class MessageExtractor:
                         tool_input = item.get("input", {})
 
                         # Special handling for specific tools
-                        if tool_name == "ExitPlanMode":
-                            # Extract plan content from ExitPlanMode tool calls
-                            if "plan" in tool_input:
-                                parts.append(tool_input["plan"])
-                        elif tool_name == "Task":
-                            # Format Task tool calls
-                            desc = tool_input.get("description", "")
-                            prompt = tool_input.get("prompt", "")
-                            subagent = tool_input.get("subagent_type", "")
-                            if desc:
-                                parts.append(f"[Task: {desc}]")
-                            if subagent:
-                                parts.append(f"Using {subagent} agent")
-                            if prompt:
-                                if self.no_truncate:
-                                    parts.append(f"Prompt: {prompt}")
-                                else:
-                                    parts.append(f"Prompt: {prompt}")
-                        elif tool_name == "Write":
-                            # Format Write tool calls
-                            file_path = tool_input.get("file_path", "")
-                            content = tool_input.get("content", "")
-                            parts.append(f"Writing to {file_path}")
-                            if content:
-                                if self.no_truncate:
-                                    parts.append(f"Content: {content}")
-                                else:
-                                    content_preview = content[:100]
-                                    suffix = "..." if len(content) > 100 else ""
-                                    parts.append(
-                                        f"Content preview: {content_preview}{suffix}"
-                                    )
-                        elif tool_name == "Edit":
-                            # Format Edit tool calls
-                            file_path = tool_input.get("file_path", "")
-                            old_str = tool_input.get("old_string", "")
-                            new_str = tool_input.get("new_string", "")
-                            parts.append(f"Editing {file_path}")
-                            if old_str:
-                                if self.no_truncate:
-                                    parts.append(f"Replacing: {old_str}")
-                                else:
-                                    truncated = old_str[:50]
-                                    suffix = "..." if len(old_str) > 50 else ""
-                                    parts.append(f"Replacing: {truncated}{suffix}")
-                            if new_str:
-                                if self.no_truncate:
-                                    parts.append(f"With: {new_str}")
-                                else:
-                                    truncated = new_str[:50]
-                                    suffix = "..." if len(new_str) > 50 else ""
-                                    parts.append(f"With: {truncated}{suffix}")
-                        elif tool_name == "Read":
-                            # Format Read tool calls
-                            file_path = tool_input.get("file_path", "")
-                            parts.append(f"Reading {file_path}")
-                        elif tool_name == "Bash":
-                            # Format Bash tool calls
-                            command = tool_input.get("command", "")
-                            desc = tool_input.get("description", "")
-                            if desc:
-                                parts.append(f"Running: {desc}")
-                            elif command:
-                                if self.no_truncate:
-                                    parts.append(f"$ {command}")
-                                else:
-                                    truncated = (
-                                        command[:100] if len(command) > 100 else command
-                                    )
-                                    suffix = "..." if len(command) > 100 else ""
-                                    parts.append(f"$ {truncated}{suffix}")
-                        elif tool_name == "Grep":
-                            # Format Grep tool calls
-                            pattern = tool_input.get("pattern", "")
-                            path = tool_input.get("path", ".")
-                            parts.append(f"Searching for '{pattern}' in {path}")
-                        elif tool_name == "Glob":
-                            # Format Glob tool calls
-                            pattern = tool_input.get("pattern", "")
-                            path = tool_input.get("path", ".")
-                            parts.append(
-                                f"Finding files matching '{pattern}' in {path}"
-                            )
+                        formatter = _TOOL_FORMATTERS.get(tool_name)
+                        if formatter is not None:
+                            formatter(tool_input, parts, no_truncate)
                         else:
-                            # Generic tool formatting
-                            parts.append(f"[{tool_name}]")
-                            # Add key parameters if they exist
-                            for key in [
-                                "file_path",
-                                "command",
-                                "pattern",
-                                "query",
-                                "description",
-                            ]:
-                                if key in tool_input:
-                                    value = str(tool_input[key])
-                                    if self.no_truncate:
-                                        parts.append(f"  {key}: {value}")
-                                    else:
-                                        truncated = (
-                                            value[:100] if len(value) > 100 else value
-                                        )
-                                        suffix = "..." if len(value) > 100 else ""
-                                        parts.append(f"  {key}: {truncated}{suffix}")
+                            _format_generic_use(
+                                tool_name, tool_input, parts, no_truncate
+                            )
                     else:
                         # Other content types - format better
                         if "type" in item:
@@ -522,3 +382,108 @@ class MessageExtractor:
 
         else:
             return str(content)
+
+
+def _preview(value: str, limit: int, no_truncate: bool) -> str:
+    """Cut value to limit characters plus '...' unless no_truncate is set."""
+    if no_truncate or len(value) <= limit:
+        return value
+    return value[:limit] + "..."
+
+
+def _format_exit_plan_use(tool_input: dict, parts: List[str], no_truncate: bool) -> None:
+    """Extract plan content from ExitPlanMode tool calls."""
+    if "plan" in tool_input:
+        parts.append(tool_input["plan"])
+
+
+def _format_task_use(tool_input: dict, parts: List[str], no_truncate: bool) -> None:
+    """Format Task tool calls."""
+    desc = tool_input.get("description", "")
+    prompt = tool_input.get("prompt", "")
+    subagent = tool_input.get("subagent_type", "")
+    if desc:
+        parts.append(f"[Task: {desc}]")
+    if subagent:
+        parts.append(f"Using {subagent} agent")
+    if prompt:
+        parts.append(f"Prompt: {prompt}")
+
+
+def _format_write_use(tool_input: dict, parts: List[str], no_truncate: bool) -> None:
+    """Format Write tool calls."""
+    file_path = tool_input.get("file_path", "")
+    content = tool_input.get("content", "")
+    parts.append(f"Writing to {file_path}")
+    if content:
+        if no_truncate:
+            parts.append(f"Content: {content}")
+        else:
+            parts.append(f"Content preview: {_preview(content, 100, False)}")
+
+
+def _format_edit_use(tool_input: dict, parts: List[str], no_truncate: bool) -> None:
+    """Format Edit tool calls."""
+    file_path = tool_input.get("file_path", "")
+    old_str = tool_input.get("old_string", "")
+    new_str = tool_input.get("new_string", "")
+    parts.append(f"Editing {file_path}")
+    if old_str:
+        parts.append(f"Replacing: {_preview(old_str, 50, no_truncate)}")
+    if new_str:
+        parts.append(f"With: {_preview(new_str, 50, no_truncate)}")
+
+
+def _format_read_use(tool_input: dict, parts: List[str], no_truncate: bool) -> None:
+    """Format Read tool calls."""
+    file_path = tool_input.get("file_path", "")
+    parts.append(f"Reading {file_path}")
+
+
+def _format_bash_use(tool_input: dict, parts: List[str], no_truncate: bool) -> None:
+    """Format Bash tool calls."""
+    command = tool_input.get("command", "")
+    desc = tool_input.get("description", "")
+    if desc:
+        parts.append(f"Running: {desc}")
+    elif command:
+        parts.append(f"$ {_preview(command, 100, no_truncate)}")
+
+
+def _format_grep_use(tool_input: dict, parts: List[str], no_truncate: bool) -> None:
+    """Format Grep tool calls."""
+    pattern = tool_input.get("pattern", "")
+    path = tool_input.get("path", ".")
+    parts.append(f"Searching for '{pattern}' in {path}")
+
+
+def _format_glob_use(tool_input: dict, parts: List[str], no_truncate: bool) -> None:
+    """Format Glob tool calls."""
+    pattern = tool_input.get("pattern", "")
+    path = tool_input.get("path", ".")
+    parts.append(f"Finding files matching '{pattern}' in {path}")
+
+
+def _format_generic_use(
+    tool_name: str, tool_input: dict, parts: List[str], no_truncate: bool
+) -> None:
+    """Format any other tool call with its key parameters."""
+    parts.append(f"[{tool_name}]")
+    # Add key parameters if they exist
+    for key in ["file_path", "command", "pattern", "query", "description"]:
+        if key in tool_input:
+            value = _preview(str(tool_input[key]), 100, no_truncate)
+            parts.append(f"  {key}: {value}")
+
+
+# Tool name -> formatter for tool_use items; anything else is generic
+_TOOL_FORMATTERS = {
+    "ExitPlanMode": _format_exit_plan_use,
+    "Task": _format_task_use,
+    "Write": _format_write_use,
+    "Edit": _format_edit_use,
+    "Read": _format_read_use,
+    "Bash": _format_bash_use,
+    "Grep": _format_grep_use,
+    "Glob": _format_glob_use,
+}
@@ -4,12 +4,52 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import re
-import hashlib
 
+try:
+    from .utils import parse_iso_timestamp
+except ImportError:
+    from utils import parse_iso_timestamp
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _loads(data: bytes) -> Any:
+        """Decode a JSON line with orjson, falling back to the stdlib.
+
+        orjson rejects some input json accepts (lone surrogate escapes,
+        NaN/Infinity, a leading BOM), so those lines are retried with json
+        rather than dropped.
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def _dumps_sorted(obj: Any) -> Any:
+        """Serialize content to a stable key-sorted form using orjson.
+
+        Content orjson cannot encode (e.g. lone surrogates from the json
+        fallback above) is serialized with json instead.
+        """
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, sort_keys=True)
+else:
+    _loads = json.loads
+
+    def _dumps_sorted(obj: Any) -> str:
+        """Serialize content to a stable key-sorted form."""
+        return json.dumps(obj, sort_keys=True)
+
+
+@dataclass(slots=True)
 class Message:
     """Represents a single message in a Claude Code session."""
     uuid: str
@@ -24,19 +64,23 @@ class Message:
     tool_args: Optional[Dict] = None
     usage: Optional[Dict] = None  # Token usage info
     message_category: Optional[str] = None  # user, subagent, plan, tool_response, etc.
+    # Parsed timestamp, filled on first access of .datetime
+    _datetime: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def datetime(self) -> datetime:
         """Get timestamp as datetime object."""
-        try:
-            # Handle both ISO format with Z and timezone-aware formats
-            timestamp_str = self.timestamp.replace('Z', '+00:00')
-            return datetime.fromisoformat(timestamp_str)
-        except (ValueError, AttributeError):
-            return datetime.now(timezone.utc)
+        dt = self._datetime
+        if dt is None:
+            # Shared memoized parser; messages often repeat a timestamp
+            dt = parse_iso_timestamp(self.timestamp)
+            if dt is None:
+                dt = datetime.now(timezone.utc)
+            self._datetime = dt
+        return dt
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     """Represents a user prompt and all assistant responses until the next user message."""
     user_message: Message
@@ -58,14 +102,16 @@ class SessionParser:
         """Parse a JSONL session file and return all messages."""
         messages = []
         
-        with open(file_path, 'r', encoding='utf-8') as f:
+        # Read raw bytes; both decoders take UTF-8 directly, so lines are
+        # never decoded to str first
+        with open(file_path, 'rb') as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
                 
                 try:
-                    raw_msg = json.loads(line)
+                    raw_msg = _loads(line)
                     message = self._parse_message(raw_msg, line_num)
                     if message:
                         messages.append(message)
@@ -344,11 +390,14 @@ class SessionParser:
         
         return git_info
     
-    def _hash_content(self, content: Any) -> str:
+    def _hash_content(self, content: Any) -> int:
         """Generate a hash for message content for deduplication."""
-        # Convert content to a stable string representation
-        content_str = json.dumps(content, sort_keys=True) if not isinstance(content, str) else content
-        return hashlib.sha256(content_str.encode()).hexdigest()[:16]
+        # Hashes are only compared within one run, so the built-in 64-bit
+        # hash is as collision-resistant as a 16-hex-digit SHA-256 prefix
+        if isinstance(content, str):
+            return hash(content)
+        # Convert content to a stable representation
+        return hash(_dumps_sorted(content))
     
     def deduplicate_messages(self, messages: List[Message]) -> List[Message]:
         """Remove duplicate messages based on UUID and content hash."""
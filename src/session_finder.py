@@ -7,6 +7,11 @@ from datetime import datetime, timezone
 from typing import List, Dict, Optional, Tuple
 import re
 
+try:
+    from .utils import parse_iso_timestamp
+except ImportError:
+    from utils import parse_iso_timestamp
+
 
 class SessionNotFoundError(Exception):
     """Raised when no sessions are found for a project."""
@@ -151,19 +156,18 @@ def filter_sessions_by_date(
         if not date_str:
             continue
         
-        try:
-            session_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            session_date = session_date.replace(tzinfo=timezone.utc)
-            
-            if from_date and session_date < from_date.replace(tzinfo=timezone.utc):
-                continue
-            if to_date and session_date > to_date.replace(tzinfo=timezone.utc):
-                continue
-                
-            filtered.append(session)
-        except (ValueError, AttributeError):
+        session_date = parse_iso_timestamp(date_str)
+        if session_date is None:
             # Skip sessions with invalid dates
             continue
+        session_date = session_date.replace(tzinfo=timezone.utc)
+
+        if from_date and session_date < from_date.replace(tzinfo=timezone.utc):
+            continue
+        if to_date and session_date > to_date.replace(tzinfo=timezone.utc):
+            continue
+
+        filtered.append(session)
     
     return filtered
 
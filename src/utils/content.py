@@ -1,7 +1,11 @@
 """Content extraction utilities."""
 
+import re
 from typing import Any
 
+# Opening and closing session hook tags, stripped in one pass
+_SESSION_HOOK_RE = re.compile(r'</?session-start-hook>')
+
 
 def extract_user_content(content: Any) -> str:
     """Extract clean text from user message content.
@@ -19,25 +23,24 @@ def extract_user_content(content: Any) -> str:
     """
     if isinstance(content, str):
         # Clean up session hooks and other noise
-        content = content.replace('<session-start-hook>', '')
-        content = content.replace('</session-start-hook>', '')
+        if 'session-start-hook' in content:
+            content = _SESSION_HOOK_RE.sub('', content)
         return content.strip()
 
     elif isinstance(content, list):
         # Handle tool results and complex content
         parts = []
+        append = parts.append
         for item in content:
-            if isinstance(item, dict):
-                if item.get('type') == 'text':
-                    parts.append(item.get('text', ''))
-                elif item.get('type') == 'tool_result':
-                    # Skip tool results in user display - they're noise
-                    continue
-                else:
-                    # Other content types
-                    parts.append(str(item))
-            else:
-                parts.append(str(item))
+            if not isinstance(item, dict):
+                append(str(item))
+                continue
+            item_type = item.get('type')
+            if item_type == 'text':
+                append(item.get('text', ''))
+            elif item_type != 'tool_result':
+                # Other content types; tool results are noise in user display
+                append(str(item))
         return '\n'.join(parts).strip()
 
     else:
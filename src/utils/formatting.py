@@ -1,5 +1,19 @@
 """Display formatting utilities."""
 
+# (exclusive lower bound, format spec, unit, short unit), largest first
+_SIZE_UNITS = (
+    (1024 * 1024, '.1f', 'MB', 'M'),
+    (1024, '.0f', 'KB', 'K'),
+)
+
+
+def _format_size(size_bytes: int, short: bool) -> str:
+    """Format a size using the first unit whose threshold it exceeds."""
+    for threshold, spec, unit, short_unit in _SIZE_UNITS:
+        if size_bytes > threshold:
+            return f"{size_bytes / threshold:{spec}}{short_unit if short else unit}"
+    return f"{size_bytes}B"
+
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format.
@@ -10,12 +24,7 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted string like '1.5MB', '256KB', '1024B'
     """
-    if size_bytes > 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f}MB"
-    elif size_bytes > 1024:
-        return f"{size_bytes / 1024:.0f}KB"
-    else:
-        return f"{size_bytes}B"
+    return _format_size(size_bytes, short=False)
 
 
 def format_file_size_short(size_bytes: int) -> str:
@@ -27,9 +36,4 @@ def format_file_size_short(size_bytes: int) -> str:
     Returns:
         Formatted string like '1.5M', '256K', '1024B'
     """
-    if size_bytes > 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f}M"
-    elif size_bytes > 1024:
-        return f"{size_bytes / 1024:.0f}K"
-    else:
-        return f"{size_bytes}B"
+    return _format_size(size_bytes, short=True)
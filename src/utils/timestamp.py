@@ -1,9 +1,19 @@
 """Timestamp parsing and formatting utilities."""
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_cached(timestamp_str: str) -> Optional[datetime]:
+    """Parse a non-empty ISO string; memoized since datetimes are immutable."""
+    try:
+        return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
 def parse_iso_timestamp(timestamp_str: Optional[str]) -> Optional[datetime]:
     """Parse ISO timestamp handling 'Z' suffix.
 
@@ -16,13 +26,10 @@ def parse_iso_timestamp(timestamp_str: Optional[str]) -> Optional[datetime]:
     Returns:
         datetime in UTC timezone, or None if parsing fails
     """
-    if not timestamp_str:
+    if not timestamp_str or not isinstance(timestamp_str, str):
         return None
 
-    try:
-        return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-    except (ValueError, AttributeError, TypeError):
-        return None
+    return _parse_iso_cached(timestamp_str)
 
 
 def parse_iso_timestamp_or_now(timestamp_str: Optional[str]) -> datetime:
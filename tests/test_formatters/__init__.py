@@ -0,0 +1 @@
+"""Tests for output formatters."""
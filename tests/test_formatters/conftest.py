@@ -0,0 +1,117 @@
+"""Shared fixtures for formatter tests."""
+
+import pytest
+
+from parser import Message, ConversationTurn
+from cache import SummaryResult
+
+
+def _message(uuid: str, type: str, content, timestamp: str) -> Message:
+    """Build a session message with fixed metadata."""
+    return Message(
+        uuid=uuid,
+        parent_uuid=None,
+        type=type,
+        timestamp=timestamp,
+        content=content,
+        session_id="s1",
+        cwd="/work",
+        git_branch="main",
+    )
+
+
+@pytest.fixture
+def session_metadata():
+    """Session metadata covering every optional field."""
+    return {
+        'session_id': "abc123-def456",
+        'message_count': 14,
+        'start_time': "2024-12-01T10:00:00Z",
+        'last_modified': "2024-12-01T11:00:00Z",
+        'file_size': 20480,
+    }
+
+
+@pytest.fixture
+def turns():
+    """Six turns, enough for the Markdown table of contents."""
+    return [
+        ConversationTurn(
+            user_message=_message(f"u{i}", "user", f"Request {i}\nwith detail", f"2024-12-01T10:0{i}:00Z"),
+            assistant_messages=[_message(f"a{i}", "assistant", "Done", f"2024-12-01T10:0{i}:30Z")],
+            system_messages=[],
+            tool_messages=[],
+            duration_seconds=30.0,
+            total_tokens=100 + i,
+        )
+        for i in range(6)
+    ]
+
+
+@pytest.fixture
+def summaries():
+    """One summary per turn, including an error and an empty summary."""
+    return [
+        SummaryResult(summary=f"Summary {i}", tool_calls=["Read", "Edit"], tokens_used=50)
+        for i in range(4)
+    ] + [
+        SummaryResult(summary="", tool_calls=[], error="timed out"),
+        SummaryResult(summary="", tool_calls=[]),
+    ]
+
+
+@pytest.fixture
+def sessions():
+    """Session-list entries, one with a long description."""
+    return [
+        {
+            'session_id': "abc123-def456",
+            'message_count': 14,
+            'file_size': 20480,
+            'start_time': "2024-12-01T10:00:00Z",
+            'last_modified': "2024-12-01T11:00:00Z",
+            'description': "Fix the parser " * 5,
+        },
+        {'session_id': "solo", 'message_count': 1, 'last_modified': "bad"},
+    ]
+
+
+@pytest.fixture
+def messages():
+    """Categorized messages with and without timestamps."""
+    return [
+        {
+            'number': 1,
+            'category': "user",
+            'content': "First line\nsecond line",
+            'uuid': "m1",
+            'timestamp': "2024-12-01T10:00:00Z",
+            'cwd': "/work",
+        },
+        {'number': 2, 'category': "plan", 'content': "The plan", 'uuid': "m2"},
+    ]
+
+
+@pytest.fixture
+def format_calls(turns, summaries, session_metadata, sessions, messages):
+    """Formatter calls by case name, each taking (formatter, output_file)."""
+    return {
+        'session_summary': lambda formatter, output_file: formatter.format_session_summary(
+            turns, summaries, session_metadata, output_file=output_file),
+        'session_summary_metadata': lambda formatter, output_file: formatter.format_session_summary(
+            turns, summaries, session_metadata, include_metadata=True, output_file=output_file),
+        'empty_session_summary': lambda formatter, output_file: formatter.format_session_summary(
+            [], [], session_metadata, output_file=output_file),
+        'session_list': lambda formatter, output_file: formatter.format_session_list(
+            sessions, output_file=output_file),
+        'session_list_verbose': lambda formatter, output_file: formatter.format_session_list(
+            sessions, output_file=output_file, verbose=True),
+        'empty_session_list': lambda formatter, output_file: formatter.format_session_list(
+            [], output_file=output_file),
+        'messages': lambda formatter, output_file: formatter.format_messages(
+            messages, session_metadata, output_file=output_file),
+        'messages_metadata': lambda formatter, output_file: formatter.format_messages(
+            messages, session_metadata, include_metadata=True, output_file=output_file),
+        'empty_messages': lambda formatter, output_file: formatter.format_messages(
+            [], session_metadata, output_file=output_file),
+    }
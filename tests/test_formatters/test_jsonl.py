@@ -0,0 +1,99 @@
+"""Tests for the JSONL formatter."""
+
+import io
+import json
+
+import pytest
+
+from formatters.jsonl import JSONLFormatter
+
+
+# Records orjson refuses to encode but json.dumps handles
+_UNENCODABLE_RECORDS = [
+    {"type": "user", "content": "lone \ud83d surrogate"},
+    {"type": "stats", "total": 2**70},
+]
+
+# Every format_calls case; each output starts with a timestamped header record
+_RECORD_CASES = [
+    'session_summary',
+    'session_summary_metadata',
+    'empty_session_summary',
+    'session_list',
+    'session_list_verbose',
+    'empty_session_list',
+    'messages',
+    'messages_metadata',
+    'empty_messages',
+]
+
+
+def _untimed_records(jsonl: str):
+    """Parse JSONL, dropping the header record's generation timestamp."""
+    records = [json.loads(line) for line in jsonl.split("\n")]
+    del records[0]["timestamp"]
+    return records
+
+
+class TestWriteRecords:
+    """Tests for JSONLFormatter._write_records."""
+
+    def test_string_path_encodes_unencodable_records(self):
+        """Should return every record when orjson rejects some of them."""
+        result = JSONLFormatter()._write_records(iter(_UNENCODABLE_RECORDS))
+        assert [json.loads(line) for line in result.split("\n")] == _UNENCODABLE_RECORDS
+
+    def test_text_file_path_encodes_unencodable_records(self):
+        """Should stream every record to a text file."""
+        output = io.StringIO()
+        result = JSONLFormatter()._write_records(iter(_UNENCODABLE_RECORDS), output)
+        assert result is None
+        lines = output.getvalue().split("\n")
+        assert [json.loads(line) for line in lines] == _UNENCODABLE_RECORDS
+
+    def test_binary_file_path_encodes_unencodable_records(self):
+        """Should stream every record to a binary file as valid UTF-8."""
+        output = io.BytesIO()
+        JSONLFormatter()._write_records(iter(_UNENCODABLE_RECORDS), output)
+        lines = output.getvalue().decode("utf-8").split("\n")
+        assert [json.loads(line) for line in lines] == _UNENCODABLE_RECORDS
+
+    def test_cache_stats_with_large_int(self):
+        """Should format cache stats holding ints beyond 64 bits."""
+        result = JSONLFormatter().format_cache_stats({"total_size_bytes": 2**70})
+        assert json.loads(result)["total_size_bytes"] == 2**70
+
+
+class TestStreamedOutput:
+    """Tests for JSONLFormatter output written to a file."""
+
+    @pytest.mark.parametrize("case", _RECORD_CASES)
+    def test_text_file_output_matches_returned_string(self, format_calls, case):
+        """Should write the same records returned without output_file."""
+        call = format_calls[case]
+        expected = call(JSONLFormatter(), None)
+
+        output = io.StringIO()
+        result = call(JSONLFormatter(), output)
+
+        assert result is None
+        assert _untimed_records(output.getvalue()) == _untimed_records(expected)
+
+    @pytest.mark.parametrize("case", _RECORD_CASES)
+    def test_binary_file_output_matches_returned_string(self, format_calls, case):
+        """Should write the same records as UTF-8 bytes to a binary file."""
+        call = format_calls[case]
+        expected = call(JSONLFormatter(), None)
+
+        output = io.BytesIO()
+        result = call(JSONLFormatter(), output)
+
+        assert result is None
+        assert _untimed_records(output.getvalue().decode("utf-8")) == _untimed_records(expected)
+
+    def test_cache_stats_file_output_matches_returned_string(self):
+        """Should write and return the same cache stats document."""
+        output = io.StringIO()
+        result = JSONLFormatter().format_cache_stats({"total_size_bytes": 1024}, output)
+
+        assert output.getvalue() == result
@@ -0,0 +1,33 @@
+"""Tests for the plain text formatter."""
+
+import io
+
+import pytest
+
+from formatters.plain import PlainFormatter
+
+
+class TestStreamedOutput:
+    """Tests for PlainFormatter output written to a file."""
+
+    @pytest.mark.parametrize("case", [
+        'session_summary',
+        'session_summary_metadata',
+        'empty_session_summary',
+        'session_list',
+        'session_list_verbose',
+        'empty_session_list',
+        'messages',
+        'messages_metadata',
+        'empty_messages',
+    ])
+    def test_file_output_matches_returned_string(self, format_calls, case):
+        """Should write exactly the string returned without output_file."""
+        call = format_calls[case]
+        expected = call(PlainFormatter(), None)
+
+        output = io.StringIO()
+        result = call(PlainFormatter(), output)
+
+        assert result is None
+        assert output.getvalue() == expected
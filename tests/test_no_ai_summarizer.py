@@ -0,0 +1,58 @@
+"""Tests for the no-AI summarizer's phrase checks."""
+
+import pytest
+
+from no_ai_summarizer import NoAISummarizer, UserOnlyExtractor
+
+
+class TestIsTodoActivity:
+    """Tests for NoAISummarizer._is_todo_activity."""
+
+    def test_matches_indicator_case_insensitively(self):
+        """Should match indicators regardless of case."""
+        assert NoAISummarizer()._is_todo_activity("TodoWrite finished")
+        assert NoAISummarizer()._is_todo_activity("\u001b[1mWorking On\u001b[22m it")
+
+    def test_ignores_unrelated_content(self):
+        """Should not match content without any indicator."""
+        assert not NoAISummarizer()._is_todo_activity("Ran the linter")
+
+
+class TestIsSystemNoise:
+    """Tests for UserOnlyExtractor._is_system_noise."""
+
+    def test_command_messages(self):
+        """Should treat command wrappers as noise."""
+        extractor = UserOnlyExtractor()
+        assert extractor._is_system_noise("<command-name>/clear</command-name>")
+        assert extractor._is_system_noise("<local-command-stdout>ok")
+        assert extractor._is_system_noise("[Request interrupted by user]")
+
+    def test_short_content_measured_after_lowercasing(self):
+        """Should apply the length cutoff to the lowercased, stripped text."""
+        extractor = UserOnlyExtractor()
+        assert extractor._is_system_noise("  short  ")
+        # 'İ' lowercases to two characters, lifting this to the cutoff
+        assert not extractor._is_system_noise("İ23456789")
+
+    def test_caveat_patterns(self):
+        """Should match caveat phrases case-insensitively."""
+        extractor = UserOnlyExtractor()
+        assert extractor._is_system_noise("Caveat: The messages below were generated")
+        assert not extractor._is_system_noise("Please refactor the parser")
+
+
+class TestIsSessionSummary:
+    """Tests for UserOnlyExtractor._is_session_summary."""
+
+    def test_continuation_phrases(self):
+        """Should match session continuation phrases case-insensitively."""
+        extractor = UserOnlyExtractor()
+        assert extractor._is_session_summary("This session is being continued from")
+        assert extractor._is_session_summary("1. Primary Request and Intent:")
+
+    def test_regular_prompt(self):
+        """Should not match an ordinary prompt or empty content."""
+        extractor = UserOnlyExtractor()
+        assert not extractor._is_session_summary("Add a --verbose flag")
+        assert not extractor._is_session_summary("")
@@ -0,0 +1,82 @@
+"""Tests for the JSONL session parser."""
+
+import json
+
+import pytest
+
+from parser import SessionParser
+from no_ai_summarizer import MessageExtractor
+from formatters.jsonl import JSONLFormatter
+
+
+def _line(uuid: str, content: str) -> bytes:
+    """Build one raw user-message line around pre-encoded JSON content."""
+    return (
+        '{"type": "user", "uuid": "%s", "timestamp": "2024-12-01T10:00:00Z", '
+        '"sessionId": "s1", "message": {"content": %s}}\n' % (uuid, content)
+    ).encode()
+
+
+class TestParseFile:
+    """Tests for SessionParser.parse_file."""
+
+    def test_parses_lines_stdlib_json_accepts(self, tmp_path):
+        """Should keep lines orjson rejects but json accepts."""
+        session_file = tmp_path / "session.jsonl"
+        session_file.write_bytes(
+            b"\xef\xbb\xbf" + _line("bom", '"after a BOM"')
+            + _line("surrogate", '"lone \\ud83d surrogate"')
+            + _line("nan", '[{"type": "text", "text": "x", "score": NaN}]')
+        )
+
+        messages = SessionParser().parse_file(session_file)
+
+        assert [m.uuid for m in messages] == ["bom", "surrogate", "nan"]
+        assert messages[0].content == "after a BOM"
+        assert messages[1].content == "lone \ud83d surrogate"
+
+    def test_deduplicates_lenient_content(self, tmp_path):
+        """Should hash content that only the stdlib decoder produced."""
+        session_file = tmp_path / "session.jsonl"
+        session_file.write_bytes(
+            _line("a", '["lone \\ud83d surrogate"]')
+            + _line("b", '["lone \\ud83d surrogate"]')
+        )
+
+        messages = SessionParser().parse_multiple_files([session_file])
+
+        assert [m.uuid for m in messages] == ["a"]
+
+    def test_skips_invalid_json(self, tmp_path, capsys):
+        """Should warn about and skip lines neither decoder accepts."""
+        session_file = tmp_path / "session.jsonl"
+        session_file.write_bytes(b"{not json\n" + _line("ok", '"fine"'))
+
+        messages = SessionParser().parse_file(session_file)
+
+        assert [m.uuid for m in messages] == ["ok"]
+        assert "Invalid JSON on line 1" in capsys.readouterr().out
+
+
+class TestLenientContentEndToEnd:
+    """Tests for lenient-decoded content flowing through to output."""
+
+    def test_lone_surrogate_reaches_jsonl_output(self, tmp_path):
+        """Should format a parsed lone-surrogate prompt as JSONL."""
+        session_file = tmp_path / "session.jsonl"
+        session_file.write_bytes(_line("u1", '"Please handle \\ud83d in the parser"'))
+
+        parser = SessionParser()
+        parser.parse_multiple_files([session_file])
+        messages = MessageExtractor().extract_messages(parser.build_conversation_turns())
+        metadata = {"session_id": "s1", "message_count": 1}
+
+        result = JSONLFormatter().format_messages(messages, metadata)
+        records = [json.loads(line) for line in result.split("\n")]
+        assert records[-1]["content"] == "Please handle \ud83d in the parser"
+
+        output_path = tmp_path / "out.jsonl"
+        with open(output_path, "w", encoding="utf-8") as output_file:
+            JSONLFormatter().format_messages(messages, metadata, output_file=output_file)
+        written = output_path.read_text(encoding="utf-8").split("\n")
+        assert json.loads(written[-1]) == records[-1]
@@ -30,6 +30,12 @@ class TestExtractUserContent:
         assert "</session-start-hook>" not in result
         assert "Actual message" in result
 
+    def test_extract_removes_repeated_session_hooks(self):
+        """Should remove every hook tag, keeping surrounding text."""
+        content = "<session-start-hook>a</session-start-hook> b <session-start-hook>c</session-start-hook>"
+        result = extract_user_content(content)
+        assert result == "a b c"
+
     def test_extract_from_list_with_text(self):
         """Should extract text from list with text items."""
         content = [{"type": "text", "text": "Hello"}]
@@ -54,6 +54,11 @@ class TestParseIsoTimestamp:
         result = parse_iso_timestamp("not-a-timestamp")
         assert result is None
 
+    def test_parse_non_string(self):
+        """Should return None for non-string input."""
+        result = parse_iso_timestamp(["2024-12-01T10:00:00Z"])
+        assert result is None
+
     def test_parse_partial_timestamp(self):
         """Should return None for partial timestamps."""
         result = parse_iso_timestamp("2024-12-01")